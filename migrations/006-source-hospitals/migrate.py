@@ -33,29 +33,32 @@ CHANGE_DESCRIPTION = "Initial sourcing from nhfr.mohp.gov.np"
 name_extractor = NameExtractor()
 
 
+# Administrative suffixes stripped by _normalize_location_name, in order
+LOCATION_SUFFIXES = (
+    "province",
+    "pradesh",
+    "प्रदेश",
+    "district",
+    "जिल्ला",
+    "metropolitan city",
+    "महानगरपालिका",
+    "sub metropolitan city",
+    "sub-metropolitan city",
+    "उपमहानगरपालिका",
+    "municipality",
+    "नगरपालिका",
+    "rural municipality",
+    "गाउँपालिका",
+)
+
+
 def _normalize_location_name(name: str) -> str:
     s = (name or "").strip().lower()
     if not s:
         return s
     s = s.replace(",", " ")
     s = " ".join(s.split())
-    suffixes = [
-        "province",
-        "pradesh",
-        "प्रदेश",
-        "district",
-        "जिल्ला",
-        "metropolitan city",
-        "महानगरपालिका",
-        "sub metropolitan city",
-        "sub-metropolitan city",
-        "उपमहानगरपालिका",
-        "municipality",
-        "नगरपालिका",
-        "rural municipality",
-        "गाउँपालिका",
-    ]
-    for suffix in suffixes:
+    for suffix in LOCATION_SUFFIXES:
         if s.endswith(suffix):
             s = s[: -len(suffix)].strip()
             s = " ".join(s.split())
@@ -193,6 +196,35 @@ async def migrate(context: MigrationContext) -> None:
                     municipality_lookup[key_ne] = loc
                     municipality_lookup[key_ne_norm] = loc
 
+    # Hospitals repeat the same few hundred province, district and
+    # municipality names, so each raw name runs the normalize/alias/lookup
+    # cascade once and later hospitals get a single dict probe
+    resolved_provinces: Dict[str, object] = {}
+    resolved_locations: Dict[str, object] = {}
+
+    def resolve_province(name: str) -> object:
+        if name not in resolved_provinces:
+            key_norm = _normalize_location_name(name)
+            key_norm = LOCATION_NAME_ALIASES.get(key_norm, key_norm)
+            key_full = name.strip().lower()
+            resolved_provinces[name] = province_lookup.get(
+                key_norm
+            ) or province_lookup.get(key_full)
+        return resolved_provinces[name]
+
+    def resolve_location(name: str) -> object:
+        if name not in resolved_locations:
+            key_norm = _normalize_location_name(name)
+            key_norm = LOCATION_NAME_ALIASES.get(key_norm, key_norm)
+            key_full = name.strip().lower()
+            resolved_locations[name] = (
+                district_lookup.get(key_norm)
+                or municipality_lookup.get(key_norm)
+                or district_lookup.get(key_full)
+                or municipality_lookup.get(key_full)
+            )
+        return resolved_locations[name]
+
     # Hospital data keys
     # 'id', 'hf_code', 'hf_name',
     # 'type', 'healthFacilityType', 'services',
@@ -373,64 +405,20 @@ async def migrate(context: MigrationContext) -> None:
             province_entity = None
 
             if province_name:
-                p_key_norm = _normalize_location_name(province_name)
-                p_key_norm = LOCATION_NAME_ALIASES.get(p_key_norm, p_key_norm)
-                p_key_full = province_name.strip().lower()
-                pe = province_lookup.get(p_key_norm) or province_lookup.get(p_key_full)
-                if pe:
-                    province_id = pe.id
-                    province_entity = pe
-
-            primary_loc_name = location_name
-            if primary_loc_name:
-                l_key_norm = _normalize_location_name(primary_loc_name)
-                l_key_norm = LOCATION_NAME_ALIASES.get(l_key_norm, l_key_norm)
-                l_key_full = primary_loc_name.strip().lower()
-                le = district_lookup.get(l_key_norm) or municipality_lookup.get(
-                    l_key_norm
-                )
-                if not le:
-                    le = district_lookup.get(l_key_full) or municipality_lookup.get(
-                        l_key_full
-                    )
-                if le:
-                    location_id = le.id
-                    location_entity = le
-                    linked_count += 1
-
-            if primary_loc_name and not location_entity:
-                fixed = _normalize_location_name(primary_loc_name)
-                raise ValueError(
-                    f"Unresolvable location '{primary_loc_name}' (normalized='{fixed}')"
-                )
-
-            if province_name and not province_entity:
-                fixed = _normalize_location_name(province_name)
-                raise ValueError(
-                    f"Unresolvable province '{province_name}' (normalized='{fixed}')"
-                )
-
-            primary_loc_name = location_name
-            if primary_loc_name:
-                l_key_norm = _normalize_location_name(primary_loc_name)
-                l_key_norm = LOCATION_NAME_ALIASES.get(l_key_norm, l_key_norm)
-                l_key_full = primary_loc_name.strip().lower()
-                le = district_lookup.get(l_key_norm) or municipality_lookup.get(
-                    l_key_norm
-                )
-                if not le:
-                    le = district_lookup.get(l_key_full) or municipality_lookup.get(
-                        l_key_full
-                    )
-                if le:
-                    location_id = le.id
-                    location_entity = le
+                province_entity = resolve_province(province_name)
+                if province_entity:
+                    province_id = province_entity.id
+
+            if location_name:
+                location_entity = resolve_location(location_name)
+                if location_entity:
+                    location_id = location_entity.id
                     linked_count += 1
 
-            if primary_loc_name and not location_entity:
-                fixed = _normalize_location_name(primary_loc_name)
+            if location_name and not location_entity:
+                fixed = _normalize_location_name(location_name)
                 raise ValueError(
-                    f"Unresolvable location '{primary_loc_name}' (normalized='{fixed}')"
+                    f"Unresolvable location '{location_name}' (normalized='{fixed}')"
                 )
 
             if province_name and not province_entity:
@@ -660,8 +648,7 @@ async def _rollback_migration(
                 entity_or_relationship_id=rel_id,
                 limit=1000,
             )
-            for v in versions:
-                await context.db.delete_version(v.id)
+            await context.db.delete_versions([v.id for v in versions])
         except Exception:
             pass
     for ent_id in reversed(created_entity_ids):
@@ -675,8 +662,7 @@ async def _rollback_migration(
                 entity_or_relationship_id=ent_id,
                 limit=1000,
             )
-            for v in versions:
-                await context.db.delete_version(v.id)
+            await context.db.delete_versions([v.id for v in versions])
         except Exception:
             pass
     try:
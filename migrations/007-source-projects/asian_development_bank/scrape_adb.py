@@ -14,7 +14,7 @@ import os
 import re
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from urllib.parse import urlencode
 
 import aiohttp
@@ -24,6 +24,9 @@ from nes.services.scraping.web_scraper import RateLimiter, RetryHandler
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Filename fragments of local XML files that are already well-formed
+KNOWN_GOOD_XML_TOKENS = ("sample_", "_fixed")
+
 
 # --- Helpers -----------------------------------------------------------------
 def first_text(elem) -> Optional[str]:
@@ -321,22 +324,27 @@ class ADBProjectScraper:
         """
         self.client = client or ADBAPIClient()
 
-    async def search_adb_projects(self) -> List[Dict[str, Any]]:
+    async def search_adb_projects(self) -> AsyncIterator[Dict[str, Any]]:
         """Search for ADB projects related to Nepal.
 
-        Returns:
-            List of project data dictionaries
+        Projects are yielded as they are normalized so callers can write them
+        out without holding the full list in memory.
+
+        Yields:
+            Project data dictionaries
         """
+        count = 0
         async with self.client:
-            projects = await self._fetch_projects_from_adb_api()
-            logger.info(f"Successfully scraped {len(projects)} projects from ADB")
-            return projects
+            async for project in self._fetch_projects_from_adb_api():
+                count += 1
+                yield project
+        logger.info(f"Successfully scraped {count} projects from ADB")
 
-    async def _fetch_projects_from_adb_api(self) -> List[Dict[str, Any]]:
+    async def _fetch_projects_from_adb_api(self) -> AsyncIterator[Dict[str, Any]]:
         """Fetch projects from ADB JSON API, with fallback to local XML if API fails.
 
-        Returns:
-            List of project data dictionaries
+        Yields:
+            Project data dictionaries
         """
         # Try to fetch from ADB JSON API for projects instead of XML
         # This is based on known ADB API endpoints for project data
@@ -376,14 +384,17 @@ class ADBProjectScraper:
                     try:
                         parsed_data = json_mod.loads(json_data)
                         # Extract projects from the JSON response
-                        projects = self._extract_projects_from_json_api_response(
+                        count = 0
+                        for project in self._extract_projects_from_json_api_response(
                             parsed_data
-                        )
-                        if projects:
+                        ):
+                            count += 1
+                            yield project
+                        if count:
                             logger.info(
-                                f"Successfully extracted {len(projects)} projects from JSON API"
+                                f"Successfully extracted {count} projects from JSON API"
                             )
-                            return projects
+                            return
                     except json_mod.JSONDecodeError as e:
                         logger.warning(
                             f"Could not parse JSON response from {api_url}: {e}"
@@ -397,6 +408,7 @@ class ADBProjectScraper:
 
         # If JSON API fails, try the IATI XML as a fallback
         xml_url = self.ADB_IATI_XML_URL
+        activities = None
         try:
             logger.info(f"Attempting to fetch data from ADB IATI XML: {xml_url}")
             xml_data = await self.client._make_request(xml_url)
@@ -428,16 +440,6 @@ class ADBProjectScraper:
                     logger.info(f"Saved parsed XML data as JSON to {parsed_json_path}")
                 except Exception as e:
                     logger.warning(f"Could not save parsed XML as JSON: {e}")
-
-                # Transform to the standardized format
-                transformed_projects = [
-                    self._normalize_adb_project(activity) for activity in activities
-                ]
-                # Filter out any None values
-                transformed_projects = [
-                    p for p in transformed_projects if p is not None
-                ]
-                return transformed_projects
             else:
                 logger.warning(
                     "ADB IATI XML request failed, trying to load from local file..."
@@ -445,22 +447,29 @@ class ADBProjectScraper:
         except Exception as e:
             logger.error(f"Error fetching from ADB IATI XML: {e}")
 
+        if activities is not None:
+            # Transform to the standardized format, skipping invalid projects
+            for activity in activities:
+                project = self._normalize_adb_project(activity)
+                if project is not None:
+                    yield project
+            return
+
         # If both API attempts fail, load from the local file as fallback
-        return await self._load_from_local_file()
+        async for project in self._load_from_local_file():
+            yield project
 
     def _extract_projects_from_json_api_response(
         self, json_data: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """Extract project data from ADB JSON API response.
 
         Args:
             json_data: Parsed JSON response from ADB API
 
-        Returns:
-            List of project data dictionaries in standard format
+        Yields:
+            Project data dictionaries in standard format
         """
-        projects = []
-
         # Handle different possible JSON response structures
         if isinstance(json_data, dict):
             # Look for projects in various possible fields
@@ -480,14 +489,14 @@ class ADBProjectScraper:
                             if isinstance(item, dict):
                                 normalized = self._normalize_adb_json_project(item)
                                 if normalized:
-                                    projects.append(normalized)
-                        return projects
+                                    yield normalized
+                        return
                     elif isinstance(data, dict):
                         # If it's a single project or a complex object
                         normalized = self._normalize_adb_json_project(data)
                         if normalized:
-                            projects.append(normalized)
-                        return projects
+                            yield normalized
+                        return
 
         elif isinstance(json_data, list):
             # If the response is directly a list of projects
@@ -495,9 +504,7 @@ class ADBProjectScraper:
                 if isinstance(item, dict):
                     normalized = self._normalize_adb_json_project(item)
                     if normalized:
-                        projects.append(normalized)
-
-        return projects
+                        yield normalized
 
     def _normalize_adb_json_project(
         self, project_data: Dict[str, Any]
@@ -791,12 +798,31 @@ class ADBProjectScraper:
         # In a real implementation, you'd need to call another endpoint to get actual projects
         return projects
 
-    async def _load_from_local_file(self) -> List[Dict[str, Any]]:
+    async def _load_from_local_file(self) -> AsyncIterator[Dict[str, Any]]:
         """Load projects from the local all_projects.xml file as a fallback.
 
-        Returns:
-            List of project data dictionaries
+        Read and parse errors are logged and yield nothing; errors while
+        normalizing propagate, since projects may already have been yielded.
+
+        Yields:
+            Project data dictionaries
         """
+        activities = self._parse_local_file()
+        if activities is None:
+            return
+
+        # Transform to the standard format, skipping invalid projects
+        count = 0
+        for activity in activities:
+            project = self._normalize_adb_project(activity)
+            if project is not None:
+                count += 1
+                yield project
+
+        logger.info(f"Loaded {count} projects from local file")
+
+    def _parse_local_file(self) -> Optional[List[Dict[str, Any]]]:
+        """Find and parse the local IATI XML file, or return None on failure."""
         try:
             # Try to locate the all_projects.xml file
             local_paths = [
@@ -835,13 +861,21 @@ class ADBProjectScraper:
                 logger.error(
                     "Could not find all_projects.xml in any of the expected locations"
                 )
-                return []
+                return None
+
+            # Sample and *_fixed* files are pre-validated, so a parse failure there
+            # is a real error rather than something _fix_common_xml_issues can repair
+            is_known_good = any(
+                tok in os.path.basename(file_path) for tok in KNOWN_GOOD_XML_TOKENS
+            )
 
             # Parse the XML data with error handling
             try:
                 activities = parse_iati_xml(xml_data)
             except Exception as parse_error:
                 logger.error(f"Error parsing XML: {parse_error}")
+                if is_known_good:
+                    return None
                 # Try to fix common XML issues and re-parse
                 xml_data = self._fix_common_xml_issues(xml_data)
                 try:
@@ -851,21 +885,13 @@ class ADBProjectScraper:
                     logger.error(
                         f"Still unable to parse XML after fixing common issues: {second_parse_error}"
                     )
-                    return []
-
-            # Transform to the standard format
-            transformed_projects = [
-                self._normalize_adb_project(activity) for activity in activities
-            ]
-            # Filter out any None values
-            transformed_projects = [p for p in transformed_projects if p is not None]
+                    return None
 
-            logger.info(f"Loaded {len(transformed_projects)} projects from local file")
-            return transformed_projects
+            return activities
 
         except Exception as e:
             logger.error(f"Error loading from local file: {e}")
-            return []
+            return None
 
     def _fix_common_xml_issues(self, xml_content: str) -> str:
         """Fix common XML issues like unescaped ampersands, less-than, and greater-than signs."""
@@ -1254,15 +1280,27 @@ async def scrape_and_save_adb_projects(output_file: str = "adb_projects.jsonl")
     output_path = os.path.join(source_dir, output_file)
 
     scraper = ADBProjectScraper()
-    projects = await scraper.search_adb_projects()
-
-    # Save projects to JSONL file (one JSON object per line)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for project in projects:
-            f.write(json.dumps(project, ensure_ascii=False, default=str) + "\n")
+    count = 0
+
+    # Stream projects into a temporary file in the same directory and only
+    # replace the committed JSONL once the scrape has finished, so a failed
+    # or interrupted run leaves the previous output intact
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            async for project in scraper.search_adb_projects():
+                f.write(json.dumps(project, ensure_ascii=False, default=str) + "\n")
+                count += 1
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
-    logger.info(f"Saved {len(projects)} ADB projects to {output_path}")
-    return len(projects)
+    logger.info(f"Saved {count} ADB projects to {output_path}")
+    return count
 
 
 if __name__ == "__main__":
@@ -8,20 +8,419 @@ project and transforms JICA data to match the standardized project schema used b
 
 import asyncio
 import csv
+import itertools
 import json
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 from urllib.parse import urlencode
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 from nes.services.scraping.web_scraper import RateLimiter, RetryHandler
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Characters stripped from project titles when building slugs
+_SLUG_RE = re.compile(r"[^\w\s-]")
+
+
+# Row counts below this are normalized inline; process startup and pickling
+# only pay off for much larger CSVs
+_PARALLEL_ROW_THRESHOLD = 1000
+_NORMALIZE_BATCH_SIZE = 500
+
+# Bump whenever the normalized output changes (fields, formats, raw_payload),
+# so JSONL cached by scrape_and_save_jica_projects is regenerated
+JICA_NORMALIZER_VERSION = 2
+
+# yen_loan.csv columns, in the order they are unpacked by _normalize_jica_row
+_COLS = (
+    "No",
+    "region",
+    "country",
+    "project name",
+    "sector",
+    "subsector",
+    "Special yen (ODA) loan / STEP",
+    "Date of approval(year/month/day)",
+    "Amount of approval(millions; jpy)",
+    "Main portion Interest rate(%)",
+    "Main portion Repayment period(years)",
+    "Main portion Grace period(years)",
+    "Main portion Tying status",
+    "Consulting portion Interest rate(%)",
+    "Consulting portion Repayment period(years)",
+    "Consulting portion Grace period(years)",
+    "Consulting portion Tying status",
+    "Executing agency",
+    "project url",
+    "ex-ante evaluation",
+    "ex-post evaluation",
+    "other url",
+    "Memo",
+)
+
+
+# Donor identity strings shared by every normalized project
+_DONOR = "Japan International Cooperation Agency"
+_DONOR_SHORT = "JICA"
+_CURRENCY_JPY = "JPY"
+_SOURCE = "JICA"
+
+# donor_extensions raw_payload keys, in output order
+_RAW_PAYLOAD_KEYS = (
+    "no",
+    "region",
+    "country",
+    "special_loan_type",
+    "ex_ante_evaluation",
+    "ex_post_evaluation",
+    "other_url",
+    "memo",
+)
+
+# Key order and constant values shared by every normalized JICA project; the
+# row-varying fields are filled in on a copy
+_PROJECT_TEMPLATE = {
+    # Entity fields
+    "slug": None,
+    "names": None,
+    "description": None,
+    # Project-specific fields
+    "stage": "ongoing",  # JICA loans are typically ongoing
+    "implementing_agency": None,  # Not specified in JICA data
+    "executing_agency": None,
+    # Financing (new FinancingCommitment format)
+    "financing": None,
+    "total_commitment": None,
+    "total_disbursement": None,  # Not provided in JICA data
+    # Timeline
+    "dates": None,
+    # Classification
+    "sectors": None,
+    "tags": None,  # Not provided in JICA data
+    # Donor extensions
+    "donor_extensions": None,
+    # URL
+    "project_url": None,
+    # Migration metadata (for relationship creation)
+    "_migration_metadata": None,
+}
+
+_FINANCING_TEMPLATE = {
+    "donor": _DONOR,
+    "amount": None,
+    "currency": _CURRENCY_JPY,
+    "assistance_type": "loan",
+    "financing_instrument": None,
+    "budget_type": "on_budget",
+    "terms": None,
+    "transaction_date": None,
+    "transaction_type": "commitment",
+    "is_actual": True,
+    "source": _SOURCE,
+}
+
+
+def _parse_float(val: Optional[str]) -> Optional[float]:
+    """Parse a CSV cell as a float, returning None for blank or invalid values."""
+    if not val:
+        return None
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_int(val: Optional[str]) -> Optional[int]:
+    """Parse a CSV cell as an int (via float), returning None for blank or invalid values."""
+    if not val:
+        return None
+    try:
+        return int(float(val))
+    except (ValueError, TypeError):
+        return None
+
+
+def _encode_jsonl_line(project: Dict[str, Any]) -> bytes:
+    """Serialize a project as one UTF-8 JSONL line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            project,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(project, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _resolve_csv_path() -> Optional[str]:
+    """Locate yen_loan.csv, honouring the JICA_CSV_PATH override."""
+    override = os.getenv("JICA_CSV_PATH")
+    if override:
+        return override
+
+    candidates = [
+        os.path.join(os.path.dirname(__file__), "yen_loan.csv"),  # Next to script
+        "migrations/007-source-projects/jica/yen_loan.csv",  # Relative to project
+    ]
+    return next((p for p in candidates if os.path.exists(p)), None)
+
+
+def _normalize_jica_row(project_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize a JICA CSV row to match nes.core.models.project.Project schema.
+
+    Uses the new FinancingCommitment format with donor at top level.
+
+    Args:
+        project_data: Raw project data from JICA CSV
+
+    Returns:
+        Normalized project data compatible with Project model, or None if invalid
+    """
+    # Bound once so the column loop below avoids a method lookup per column
+    get = project_data.get
+    try:
+        # Pull every column once, stripped, instead of probing the row repeatedly
+        (
+            row_no,
+            region,
+            country,
+            title,
+            sector,
+            subsector,
+            special_loan,
+            approval_date,
+            loan_amount_str,
+            main_interest_str,
+            main_repayment_str,
+            main_grace_str,
+            main_tying,
+            consulting_interest_str,
+            consulting_repayment_str,
+            consulting_grace_str,
+            consulting_tying,
+            executing_agency,
+            project_url,
+            ex_ante_evaluation,
+            ex_post_evaluation,
+            other_url,
+            memo,
+        ) = [(get(col) or "").strip() for col in _COLS]
+
+        # --- Extract title ---
+        if not title:
+            logger.debug(f"Skipping project with no title: {project_data}")
+            return None
+
+        # --- Generate slug and project ID ---
+        clean_name = _SLUG_RE.sub("", title).lower().replace(" ", "-")[:50]
+        date_suffix = approval_date.replace("-", "") if approval_date else "unknown"
+        slug = f"jica-{clean_name}-{date_suffix}"
+        jica_project_id = f"JICA-{date_suffix}-{clean_name[:30]}"
+
+        # --- Extract description ---
+        description = "".join(
+            (
+                "JICA Yen Loan project: ",
+                title,
+                f". Sector: {sector}" if sector else "",
+                f". Subsector: {subsector}" if subsector else "",
+            )
+        )
+
+        # --- Extract executing agency ---
+        executing_agency = executing_agency or None
+
+        # --- Extract dates ---
+        dates = []
+        if approval_date:
+            dates.append(
+                {
+                    "date": approval_date,
+                    "type": "APPROVAL",
+                    "source": _SOURCE,
+                }
+            )
+
+        # --- Extract financing (new FinancingCommitment format) ---
+        financing = []
+
+        # Parse loan amount (in millions JPY)
+        loan_amount = None
+        if loan_amount_str:
+            try:
+                loan_amount = float(loan_amount_str) * 1_000_000  # Convert to JPY
+            except (ValueError, TypeError):
+                pass
+
+        # Determine financing instrument
+        if special_loan:
+            financing_instrument = f"JICA {special_loan}"
+        else:
+            financing_instrument = "JICA Yen Loan"
+
+        # Parse loan terms for main portion
+        # (skipped entirely when every raw cell is blank)
+        main_terms = None
+        if main_interest_str or main_repayment_str or main_grace_str or main_tying:
+            main_interest = _parse_float(main_interest_str)
+            main_repayment = _parse_int(main_repayment_str)
+            main_grace = _parse_int(main_grace_str)
+
+            if any((main_interest, main_repayment, main_grace, main_tying)):
+                main_terms = {
+                    "interest_rate": main_interest,
+                    "repayment_period_years": main_repayment,
+                    "grace_period_years": main_grace,
+                    "tying_status": main_tying if main_tying else None,
+                }
+
+        # Create main financing commitment
+        if loan_amount:
+            commitment = _FINANCING_TEMPLATE.copy()
+            commitment["amount"] = loan_amount
+            commitment["financing_instrument"] = financing_instrument
+            commitment["terms"] = main_terms
+            commitment["transaction_date"] = approval_date if approval_date else None
+            financing.append(commitment)
+
+        # Check for consulting portion (separate financing entry)
+        if (
+            consulting_interest_str
+            or consulting_repayment_str
+            or consulting_grace_str
+            or consulting_tying
+        ):
+            consulting_interest = _parse_float(consulting_interest_str)
+            consulting_repayment = _parse_int(consulting_repayment_str)
+            consulting_grace = _parse_int(consulting_grace_str)
+
+            if any(
+                (
+                    consulting_interest,
+                    consulting_repayment,
+                    consulting_grace,
+                    consulting_tying,
+                )
+            ):
+                consulting_terms = {
+                    "interest_rate": consulting_interest,
+                    "repayment_period_years": consulting_repayment,
+                    "grace_period_years": consulting_grace,
+                    "tying_status": consulting_tying if consulting_tying else None,
+                }
+                # Note: Consulting portion amount not separately specified in CSV
+                # We record the terms but not a separate amount
+                commitment = _FINANCING_TEMPLATE.copy()
+                commitment["financing_instrument"] = "JICA Consulting Portion"
+                commitment["terms"] = consulting_terms
+                commitment["transaction_date"] = (
+                    approval_date if approval_date else None
+                )
+                financing.append(commitment)
+
+        # --- Extract sectors ---
+        sectors = []
+        if sector:
+            sectors.append(
+                {
+                    "normalized_sector": None,
+                    "donor_sector": sector,
+                    "donor_subsector": subsector if subsector else None,
+                    "donor": _DONOR,
+                    "percentage": None,
+                }
+            )
+
+        # --- Build donor extension ---
+        donor_extensions = [
+            {
+                "donor": _DONOR_SHORT,
+                "donor_project_id": jica_project_id,
+                # Blank cells are left out rather than stored as ""
+                "raw_payload": {
+                    key: value
+                    for key, value in zip(
+                        _RAW_PAYLOAD_KEYS,
+                        (
+                            row_no,
+                            region,
+                            country,
+                            special_loan,
+                            ex_ante_evaluation,
+                            ex_post_evaluation,
+                            other_url,
+                            memo,
+                        ),
+                    )
+                    if value
+                },
+            }
+        ]
+
+        # --- Build project URL ---
+        project_url = project_url or None
+
+        # --- Build normalized project ---
+        normalized_project = _PROJECT_TEMPLATE.copy()
+        normalized_project["slug"] = slug
+        normalized_project["names"] = [{"en": {"full": title}}]
+        normalized_project["description"] = description
+        normalized_project["executing_agency"] = executing_agency
+        normalized_project["financing"] = financing if financing else None
+        normalized_project["total_commitment"] = loan_amount
+        normalized_project["dates"] = dates if dates else None
+        normalized_project["sectors"] = sectors if sectors else None
+        normalized_project["donor_extensions"] = donor_extensions
+        normalized_project["project_url"] = project_url
+        normalized_project["_migration_metadata"] = {
+            "jica_project_id": jica_project_id,
+            "implementing_agencies": [],
+            "executing_agencies": ([executing_agency] if executing_agency else []),
+            "development_agencies": [_DONOR],
+        }
+
+        return normalized_project
+
+    except Exception as e:
+        logger.error(f"Error normalizing JICA project: {e}")
+        logger.debug(f"Problematic project data: {project_data}")
+        return None
+
+
+def _normalize_jica_record(project_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize one CSV row dict, rejecting summary and untitled rows up front."""
+    # CSV rows are effectively never repeated, so they are normalized directly
+    # rather than through a cache keyed on the row
+    row_no = project_data.get("No")
+    title = project_data.get("project name")
+    if not row_no or not row_no.strip() or not title or not title.strip():
+        return None
+
+    return _normalize_jica_row(project_data)
+
+
+def _take_rows(rows: Iterable[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
+    """Read up to n rows; run off the event loop since it does file I/O."""
+    return list(itertools.islice(rows, n))
+
+
+def _normalize_jica_batch(
+    rows: List[Dict[str, Any]],
+) -> List[Optional[Dict[str, Any]]]:
+    """Normalize a batch of CSV rows; the unit of work sent to the process pool."""
+    return [_normalize_jica_record(row) for row in rows]
+
 
 class JICAAPIClient:
     """HTTP client for JICA data access with rate limiting and retry logic."""
@@ -32,6 +431,9 @@ class JICAAPIClient:
         requests_per_minute: int = 30,
         max_retries: int = 3,
         timeout: int = 30,
+        max_connections: int = 20,
+        limit_per_host: int = 10,
+        concurrent_limit: int = 10,
     ):
         """Initialize the JICA API client.
 
@@ -40,6 +442,9 @@ class JICAAPIClient:
             requests_per_minute: Maximum requests per minute per domain
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
+            max_connections: Size of the shared connection pool
+            limit_per_host: Maximum simultaneous connections to a single host
+            concurrent_limit: Maximum requests in flight at once
         """
         self.rate_limiter = RateLimiter(
             requests_per_second=requests_per_second,
@@ -47,24 +452,53 @@ class JICAAPIClient:
         )
         self.retry_handler = RetryHandler(max_retries=max_retries)
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.limit_per_host = limit_per_host
+        self.session = None
+        self._session_lock = asyncio.Lock()
+        # The rate limiter paces arrivals; the semaphore caps in-flight requests
+        self._request_semaphore = asyncio.Semaphore(concurrent_limit)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        The session (and its keep-alive connection pool) lives for the lifetime
+        of the client instead of being rebuilt for every scrape.
+        """
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                # Tuned pool with DNS caching instead of the default connector
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                )
+                # Create a session that can store cookies for authentication
+                self.session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    connector=connector,
+                    headers={
+                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
+                        "Accept": "application/json, text/html, */*",
+                    },
+                )
+            return self.session
+
+    async def close(self) -> None:
+        """Close the shared session, if one was opened."""
+        if self.session and not self.session.closed:
+            await self.session.close()
         self.session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        # Create a session that can store cookies for authentication
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/html, */*",
-            },
-        )
+        await self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
 
     async def _make_request(
         self, url: str, params: Optional[Dict] = None
@@ -78,13 +512,7 @@ class JICAAPIClient:
         Returns:
             Response data or None if request fails
         """
-        if not self.session:
-            raise RuntimeError(
-                "Client not initialized. Use within async context manager."
-            )
-
-        # Apply rate limiting
-        await self.rate_limiter.acquire("jica.go.jp")
+        session = await self._get_session()
 
         # Prepare URL with parameters
         if params:
@@ -93,20 +521,33 @@ class JICAAPIClient:
         else:
             full_url = url
 
-        try:
-            # Use browser-like headers to mimic web requests
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/html, */*",
-                "Accept-Encoding": "gzip, deflate",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Cache-Control": "no-cache",
-                "Pragma": "no-cache",
-            }
-
-            async with self.session.get(full_url, headers=headers) as response:
+        # Use browser-like headers to mimic web requests
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
+            "Accept": "application/json, text/html, */*",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Cache-Control": "no-cache",
+            "Pragma": "no-cache",
+        }
+
+        async def fetch() -> Optional[Dict]:
+            # Apply rate limiting to every attempt, including retries
+            await self.rate_limiter.acquire("jica.go.jp")
+
+            async with self._request_semaphore, session.get(
+                full_url, headers=headers
+            ) as response:
                 if response.status == 200:
                     return await response.json()
+                elif response.status == 429 or response.status >= 500:
+                    # Transient failures are raised so the retry handler backs off
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=f"Retryable status {response.status}",
+                    )
                 elif response.status == 401:
                     logger.warning(
                         f"Unauthorized access to {full_url}. Need proper authentication."
@@ -123,6 +564,9 @@ class JICAAPIClient:
                 )
                 logger.warning(f"Response text: {await response.text()}")
                 return None
+
+        try:
+            return await self.retry_handler.execute_with_retry(fetch)
         except asyncio.TimeoutError:
             logger.error(f"Request timeout for URL: {full_url}")
             return None
@@ -134,6 +578,9 @@ class JICAAPIClient:
 class JICAProjectScraper:
     """Scraper for JICA (Japan International Cooperation Agency) projects in Nepal."""
 
+    # Resolved once at import time rather than probed on every scrape
+    CSV_PATH = _resolve_csv_path()
+
     def __init__(self, client: Optional[JICAAPIClient] = None):
         """Initialize the JICA project scraper.
 
@@ -141,345 +588,134 @@ class JICAProjectScraper:
             client: JICAAPIClient instance. If None, a default client will be created
         """
         self.client = client or JICAAPIClient()
+        # Whether the last CSV load read every row; errors are logged and
+        # swallowed by the loader, so callers check this instead
+        self.last_load_complete = False
 
-    async def search_jica_projects(self) -> List[Dict[str, Any]]:
+    async def search_jica_projects(self) -> AsyncIterator[Dict[str, Any]]:
         """Search for JICA projects related to Nepal.
 
-        Returns:
-            List of project data dictionaries
+        Yields:
+            Project data dictionaries
         """
-        async with self.client:
-            projects = await self._load_jica_projects_from_csv()
-            logger.info(
-                f"Successfully loaded and transformed {len(projects)} projects from JICA"
-            )
-            return projects
+        count = 0
+        async for project in self._load_jica_projects_from_csv():
+            count += 1
+            yield project
+        logger.info(f"Successfully loaded and transformed {count} projects from JICA")
 
-    async def _load_jica_projects_from_csv(self) -> List[Dict[str, Any]]:
+    async def _load_jica_projects_from_csv(self) -> AsyncIterator[Dict[str, Any]]:
         """Load JICA projects from the existing CSV file.
 
-        Returns:
-            List of project data dictionaries
+        Rows are read straight off the file handle and normalized one at a
+        time, so the CSV is never held in memory. Reads and inline
+        normalization run in a worker thread to keep the event loop free.
+
+        Yields:
+            Project data dictionaries
         """
+        self.last_load_complete = False
         try:
-            # Try to locate the yen_loan.csv file
-            local_paths = [
-                "yen_loan.csv",  # Relative to current script
-                "../jica/yen_loan.csv",  # One level up
-                "migrations/007-source-projects/jica/yen_loan.csv",  # Full path relative to project
-                "/Users/interstellarninja/Documents/projects/nyc/Nepal-Development-Project-Service/migrations/007-source-projects/jica/yen_loan.csv",
-            ]
-
-            csv_data = None
-            file_path = None
-
-            for path in local_paths:
-                try:
-                    abs_path = os.path.join(os.path.dirname(__file__), path)
-                    if os.path.exists(abs_path):
-                        file_path = abs_path
-                        with open(abs_path, "r", encoding="utf-8") as f:
-                            csv_content = f.read()
-                        logger.info(f"Loaded data from local CSV file: {file_path}")
-
-                        # Parse the CSV content
-                        lines = csv_content.strip().split("\n")
-                        reader = csv.DictReader(lines)
-                        csv_data = [dict(row) for row in reader]
-                        break
-                except Exception as e:
-                    logger.debug(f"Could not load from {path}: {e}")
-                    continue
-
-            if csv_data is None:
+            file_path = self.CSV_PATH
+            if file_path is None:
                 logger.error(
                     "Could not find yen_loan.csv in any of the expected locations"
                 )
-                return []
-
-            # Transform CSV data to normalized projects
-            transformed_projects = []
-            for row in csv_data:
-                # Skip summary row
-                if row.get("No", "").strip() == "":
-                    continue
-
-                normalized = self._normalize_jica_project(row)
-                if normalized:
-                    transformed_projects.append(normalized)
-
-            # Filter out any None values
-            transformed_projects = [p for p in transformed_projects if p is not None]
-            logger.info(
-                f"Successfully transformed {len(transformed_projects)} JICA projects from CSV data"
-            )
-            return transformed_projects
+                return
+
+            # Transform CSV rows to normalized projects as they are read
+            count = 0
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                logger.info(f"Loaded data from local CSV file: {file_path}")
+                rows = csv.DictReader(f)
+
+                head = await asyncio.to_thread(
+                    _take_rows, rows, _PARALLEL_ROW_THRESHOLD
+                )
+                if len(head) < _PARALLEL_ROW_THRESHOLD:
+                    batch = await asyncio.to_thread(_normalize_jica_batch, head)
+                    for normalized in batch:
+                        if normalized:
+                            count += 1
+                            yield normalized
+                else:
+                    async for normalized in self._normalize_in_process_pool(
+                        itertools.chain(head, rows)
+                    ):
+                        if normalized:
+                            count += 1
+                            yield normalized
+
+            logger.info(f"Successfully transformed {count} JICA projects from CSV data")
+            self.last_load_complete = True
 
         except Exception as e:
             logger.error(f"Error loading from CSV file: {e}")
-            return []
+
+    async def _normalize_in_process_pool(
+        self, rows: Iterable[Dict[str, Any]]
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Normalize rows across CPU cores, preserving input order.
+
+        Rows are sent in batches and only a bounded number of batches is in
+        flight at once, so the CSV is still streamed rather than loaded whole.
+        """
+        loop = asyncio.get_running_loop()
+        workers = os.cpu_count() or 1
+        pending: deque = deque()
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                batch = await asyncio.to_thread(_take_rows, rows, _NORMALIZE_BATCH_SIZE)
+                if batch:
+                    pending.append(
+                        loop.run_in_executor(pool, _normalize_jica_batch, batch)
+                    )
+                if pending and (not batch or len(pending) >= workers * 2):
+                    for normalized in await pending.popleft():
+                        yield normalized
+                elif not batch:
+                    break
 
     def _normalize_jica_project(
         self, project_data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Normalize JICA project to match nes.core.models.project.Project schema.
 
-        Uses the new FinancingCommitment format with donor at top level.
-
         Args:
             project_data: Raw project data from JICA CSV
 
         Returns:
             Normalized project data compatible with Project model, or None if invalid
         """
-        try:
-            import re
+        return _normalize_jica_record(project_data)
 
-            # --- Extract title ---
-            title = project_data.get("project name", "").strip()
-            if not title:
-                logger.debug(f"Skipping project with no title: {project_data}")
-                return None
-
-            # --- Generate slug and project ID ---
-            approval_date = project_data.get(
-                "Date of approval(year/month/day)", ""
-            ).strip()
-            clean_name = re.sub(r"[^\w\s-]", "", title).lower().replace(" ", "-")[:50]
-            date_suffix = approval_date.replace("-", "") if approval_date else "unknown"
-            slug = f"jica-{clean_name}-{date_suffix}"
-            jica_project_id = f"JICA-{date_suffix}-{clean_name[:30]}"
-
-            # --- Extract description ---
-            sector = project_data.get("sector", "")
-            subsector = project_data.get("subsector", "")
-            description = f"JICA Yen Loan project: {title}"
-            if sector:
-                description += f". Sector: {sector}"
-            if subsector:
-                description += f". Subsector: {subsector}"
-
-            # --- Extract executing agency ---
-            executing_agency = (
-                project_data.get("Executing agency", "")
-                or project_data.get("executing_agency", "")
-                or None
-            )
 
-            # --- Extract dates ---
-            dates = []
-            if approval_date:
-                dates.append(
-                    {
-                        "date": approval_date,
-                        "type": "APPROVAL",
-                        "source": "JICA",
-                    }
-                )
-
-            # --- Extract financing (new FinancingCommitment format) ---
-            financing = []
-            loan_amount_str = project_data.get("Amount of approval(millions; jpy)", "")
-
-            # Parse loan amount (in millions JPY)
-            loan_amount = None
-            if loan_amount_str:
-                try:
-                    loan_amount = float(loan_amount_str) * 1_000_000  # Convert to JPY
-                except (ValueError, TypeError):
-                    pass
-
-            # Determine financing instrument
-            special_loan = project_data.get("Special yen (ODA) loan / STEP", "").strip()
-            if special_loan:
-                financing_instrument = f"JICA {special_loan}"
-            else:
-                financing_instrument = "JICA Yen Loan"
-
-            # Parse loan terms for main portion
-            def parse_float(val):
-                try:
-                    return float(val) if val else None
-                except (ValueError, TypeError):
-                    return None
-
-            def parse_int(val):
-                try:
-                    return int(float(val)) if val else None
-                except (ValueError, TypeError):
-                    return None
-
-            main_terms = None
-            main_interest = parse_float(
-                project_data.get("Main portion Interest rate(%)", "")
-            )
-            main_repayment = parse_int(
-                project_data.get("Main portion Repayment period(years)", "")
-            )
-            main_grace = parse_int(
-                project_data.get("Main portion Grace period(years)", "")
-            )
-            main_tying = project_data.get("Main portion Tying status", "").strip()
-
-            if any([main_interest, main_repayment, main_grace, main_tying]):
-                main_terms = {
-                    "interest_rate": main_interest,
-                    "repayment_period_years": main_repayment,
-                    "grace_period_years": main_grace,
-                    "tying_status": main_tying if main_tying else None,
-                }
-
-            # Create main financing commitment
-            if loan_amount:
-                financing.append(
-                    {
-                        "donor": "Japan International Cooperation Agency",
-                        "amount": loan_amount,
-                        "currency": "JPY",
-                        "assistance_type": "loan",
-                        "financing_instrument": financing_instrument,
-                        "budget_type": "on_budget",
-                        "terms": main_terms,
-                        "transaction_date": approval_date if approval_date else None,
-                        "transaction_type": "commitment",
-                        "is_actual": True,
-                        "source": "JICA",
-                    }
-                )
-
-            # Check for consulting portion (separate financing entry)
-            consulting_interest = parse_float(
-                project_data.get("Consulting portion Interest rate(%)", "")
-            )
-            consulting_repayment = parse_int(
-                project_data.get("Consulting portion Repayment period(years)", "")
-            )
-            consulting_grace = parse_int(
-                project_data.get("Consulting portion Grace period(years)", "")
-            )
-            consulting_tying = project_data.get(
-                "Consulting portion Tying status", ""
-            ).strip()
-
-            if any(
-                [
-                    consulting_interest,
-                    consulting_repayment,
-                    consulting_grace,
-                    consulting_tying,
-                ]
-            ):
-                consulting_terms = {
-                    "interest_rate": consulting_interest,
-                    "repayment_period_years": consulting_repayment,
-                    "grace_period_years": consulting_grace,
-                    "tying_status": consulting_tying if consulting_tying else None,
-                }
-                # Note: Consulting portion amount not separately specified in CSV
-                # We record the terms but not a separate amount
-                financing.append(
-                    {
-                        "donor": "Japan International Cooperation Agency",
-                        "amount": None,  # Consulting portion amount not specified
-                        "currency": "JPY",
-                        "assistance_type": "loan",
-                        "financing_instrument": "JICA Consulting Portion",
-                        "budget_type": "on_budget",
-                        "terms": consulting_terms,
-                        "transaction_date": approval_date if approval_date else None,
-                        "transaction_type": "commitment",
-                        "is_actual": True,
-                        "source": "JICA",
-                    }
-                )
-
-            # --- Extract sectors ---
-            sectors = []
-            if sector:
-                sectors.append(
-                    {
-                        "normalized_sector": None,
-                        "donor_sector": sector,
-                        "donor_subsector": subsector if subsector else None,
-                        "donor": "Japan International Cooperation Agency",
-                        "percentage": None,
-                    }
-                )
-
-            # --- Build donor extension ---
-            donor_extensions = [
-                {
-                    "donor": "JICA",
-                    "donor_project_id": jica_project_id,
-                    "raw_payload": {
-                        "no": project_data.get("No", ""),
-                        "region": project_data.get("region", ""),
-                        "country": project_data.get("country", ""),
-                        "special_loan_type": special_loan,
-                        "ex_ante_evaluation": project_data.get(
-                            "ex-ante evaluation", ""
-                        ),
-                        "ex_post_evaluation": project_data.get(
-                            "ex-post evaluation", ""
-                        ),
-                        "other_url": project_data.get("other url", ""),
-                        "memo": project_data.get("Memo", ""),
-                    },
-                }
-            ]
-
-            # --- Build project URL ---
-            project_url = project_data.get("project url", "").strip() or None
-
-            # --- Build normalized project ---
-            normalized_project = {
-                # Entity fields
-                "slug": slug,
-                "names": [{"en": {"full": title}}],
-                "description": description,
-                # Project-specific fields
-                "stage": "ongoing",  # JICA loans are typically ongoing
-                "implementing_agency": None,  # Not specified in JICA data
-                "executing_agency": executing_agency,
-                # Financing (new FinancingCommitment format)
-                "financing": financing if financing else None,
-                "total_commitment": loan_amount,
-                "total_disbursement": None,  # Not provided in JICA data
-                # Timeline
-                "dates": dates if dates else None,
-                # Classification
-                "sectors": sectors if sectors else None,
-                "tags": None,  # Not provided in JICA data
-                # Donor extensions
-                "donor_extensions": donor_extensions,
-                # URL
-                "project_url": project_url,
-                # Migration metadata (for relationship creation)
-                "_migration_metadata": {
-                    "jica_project_id": jica_project_id,
-                    "implementing_agencies": [],
-                    "executing_agencies": (
-                        [executing_agency] if executing_agency else []
-                    ),
-                    "development_agencies": ["Japan International Cooperation Agency"],
-                },
-            }
-
-            return normalized_project
-
-        except Exception as e:
-            logger.error(f"Error normalizing JICA project: {e}")
-            logger.debug(f"Problematic project data: {project_data}")
-            return None
+def _csv_cache_key(csv_path: Optional[str]) -> Optional[str]:
+    """Identify a CSV revision (mtime and size) and the normalizer that read it."""
+    if not csv_path:
+        return None
+    try:
+        stat = os.stat(csv_path)
+    except OSError:
+        return None
+    return f"v{JICA_NORMALIZER_VERSION}-{stat.st_mtime_ns}-{stat.st_size}"
 
 
 async def scrape_and_save_jica_projects(
     output_file: str = "jica_projects.jsonl",
+    force: bool = False,
 ) -> int:
     """Scrape JICA projects and save to a JSONL file.
 
+    The output is a pure function of yen_loan.csv and the normalizer, so
+    when the CSV's mtime and size and JICA_NORMALIZER_VERSION match the
+    sidecar written by the previous complete run, the existing JSONL is
+    reused without re-parsing.
+
     Args:
         output_file: Name of the output file (JSONL format)
+        force: Re-transform even if the cached output is still valid
 
     Returns:
         Number of projects scraped and saved
@@ -495,17 +731,45 @@ async def scrape_and_save_jica_projects(
 
     # Create the full output path
     output_path = os.path.join(source_dir, output_file)
+    cache_key_path = f"{output_path}.cachekey"
 
     scraper = JICAProjectScraper()
-    projects = await scraper.search_jica_projects()
+    cache_key = _csv_cache_key(scraper.CSV_PATH)
 
-    # Save projects to JSONL file (one JSON object per line)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for project in projects:
-            f.write(json.dumps(project, ensure_ascii=False, default=str) + "\n")
-
-    logger.info(f"Saved {len(projects)} JICA projects to {output_path}")
-    return len(projects)
+    if not force and cache_key and os.path.exists(output_path):
+        try:
+            with open(cache_key_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key:
+                logger.info(f"Cache hit: {output_path} is up to date with the JICA CSV")
+                return cached["count"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # The JSONL is about to be overwritten, so the old key no longer vouches
+    # for it; it is rewritten only once this run completes
+    try:
+        os.remove(cache_key_path)
+    except FileNotFoundError:
+        pass
+
+    count = 0
+
+    # Save projects to JSONL file (one JSON object per line) as they are produced
+    try:
+        with open(output_path, "wb") as f:
+            async for project in scraper.search_jica_projects():
+                f.write(_encode_jsonl_line(project))
+                count += 1
+    finally:
+        await scraper.client.close()
+
+    if cache_key and scraper.last_load_complete:
+        with open(cache_key_path, "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "count": count}, f)
+
+    logger.info(f"Saved {count} JICA projects to {output_path}")
+    return count
 
 
 if __name__ == "__main__":
@@ -10,13 +10,28 @@ Author: Nepal Development Project Team
 Date: 2025-01-26
 """
 
+import asyncio
+import hashlib
 import html
 import json
+import re
 import sys
-from datetime import datetime, timezone
-from html.parser import HTMLParser
+from datetime import date, datetime, timezone
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+try:
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+except ImportError:  # Optional speedup; fall back to difflib's quick ratios
+    _indel_ratio = None
 
 # Add migration directory to path for local imports
 _migration_dir = Path(__file__).parent
@@ -27,24 +42,29 @@ from project_matcher import (  # noqa: E402
     ADBMatcher,
     JICAMatcher,
     MatchLevel,
+    ProjectIndex,
     ProjectMatcher,
     WorldBankMatcher,
 )
 
 from nes.core.models import (  # noqa: E402
     Address,
-    Attribution,
-    ExternalIdentifier,
+    IdentifierScheme,
     LangText,
     LangTextValue,
     Name,
     NameParts,
+    ProvenanceMethod,
 )
 from nes.core.models.base import NameKind  # noqa: E402
 from nes.core.models.entity import EntitySubType, EntityType  # noqa: E402
 from nes.core.models.version import Author  # noqa: E402
 from nes.core.utils.slug_helper import text_to_slug  # noqa: E402
 from nes.services.migration.context import MigrationContext  # noqa: E402
+from nes.services.publication import (  # noqa: E402
+    RelationshipBatchStoreError,
+    RelationshipBatchValidationError,
+)
 from nes.services.scraping.normalization import NameExtractor  # noqa: E402
 
 # Migration metadata
@@ -53,22 +73,44 @@ DATE = "2025-01-26"
 DESCRIPTION = "Import development projects for Nepal from multiple sources"
 CHANGE_DESCRIPTION = "Initial sourcing from MoF DFMIS API"
 
+# Source prefixes stripped from project slugs to recover the source project ID
+_SLUG_PREFIXES = ("dfmis-", "wb-", "adb-", "jica-")
+
 name_extractor = NameExtractor()
 
+# JSONL line parser; orjson parses bytes directly when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
-class _HTMLStripper(HTMLParser):
-    """Simple HTML tag stripper for converting HTML content to plain text."""
+@lru_cache(maxsize=8192)
+def _slug(text: str) -> str:
+    """Memoized text_to_slug; organization names recur across sources."""
+    return text_to_slug(text)
 
-    def __init__(self):
-        super().__init__()
-        self.reset()
-        self.fed = []
 
-    def handle_data(self, d):
-        self.fed.append(d)
+# Separator of comma-joined agency names, absorbing surrounding whitespace
+_SPLIT_COMMA = re.compile(r"\s*,\s*")
 
-    def get_data(self):
-        return "".join(self.fed)
+
+def _split_names(value: Optional[str]) -> List[str]:
+    """Split a comma-joined name list into stripped (possibly empty) names."""
+    return _SPLIT_COMMA.split(value.strip()) if value else []
+
+
+# Matches a single HTML/XML tag (or comment) for _strip_html_tags.
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> Optional[date]:
+    """Parse an ISO date/datetime string; dates recur across projects."""
+    # Replace a trailing 'Z' with '+00:00' for proper ISO format parsing
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except ValueError:
+        return None
 
 
 def _parse_date(date_input):
@@ -76,101 +118,407 @@ def _parse_date(date_input):
     if not date_input:
         return None
 
-    try:
-        if isinstance(date_input, str):
-            # Replace 'Z' with '+00:00' for proper ISO format parsing
-            iso_date = date_input.replace("Z", "+00:00")
-            return datetime.fromisoformat(iso_date).date()
-        elif hasattr(date_input, "date"):  # datetime object
+    # datetime subclasses date, so check it first
+    if isinstance(date_input, datetime):
+        return date_input.date()
+    if isinstance(date_input, date):
+        return date_input
+    if isinstance(date_input, str):
+        return _parse_date_str(date_input)
+    if hasattr(date_input, "date"):  # datetime-like object
+        try:
             return date_input.date()
-        else:
-            return date_input
-    except Exception:
-        return None
-
-
-def _strip_html_tags(text: str) -> str:
-    """Strip HTML tags from text content and return plain text."""
+        except Exception:
+            return None
+    return date_input
+
+
+# Initial prefix of a description, as a multiple of max_len, cleaned when the
+# result is truncated; markup is a small share of most descriptions
+_HTML_PREFIX_FACTOR = 2
+
+# Characters that end a character reference; a prefix is cut back to its last
+# "&" unless one of these follows it, so no reference is split
+_REF_END_RE = re.compile(r"[\t\n\f <;]")
+
+
+def _clean_html(text: str) -> str:
+    """Unescape entities, then remove tags."""
+    # Plain-text descriptions (most WB/ADB/JICA rows) skip unescaping and
+    # the regex scan
+    if "&" in text:
+        text = html.unescape(text)
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    return text
+
+
+def _clean_html_prefix(text: str, limit: int) -> str:
+    """Clean text[:limit], cut back so the result is a prefix of cleaning text."""
+    prefix = text[:limit]
+    amp = prefix.rfind("&")
+    if amp != -1 and not _REF_END_RE.search(prefix, amp + 1):
+        prefix = prefix[:amp]
+    if "&" in prefix:
+        prefix = html.unescape(prefix)
+    # A "<" after the last ">" could be closed beyond the cut
+    lt = prefix.find("<", prefix.rfind(">") + 1)
+    if lt != -1:
+        prefix = prefix[:lt]
+    if "<" in prefix:
+        prefix = _TAG_RE.sub("", prefix)
+    return prefix
+
+
+def _strip_html_tags(text: str, max_len: Optional[int] = None) -> str:
+    """Strip HTML tags from text content and return plain text.
+
+    If max_len is given the result is truncated to that many characters, and
+    only as much of the input as that needs is unescaped and scanned.
+    """
     if not text:
         return text
 
-    unescaped = html.unescape(text)
-    stripper = _HTMLStripper()
-    stripper.feed(unescaped)
-    return stripper.get_data().strip()
+    if max_len is not None:
+        limit = max(max_len, 1) * _HTML_PREFIX_FACTOR
+        while limit < len(text):
+            cleaned = _clean_html_prefix(text, limit).strip()
+            # Enough text survives stripping, so the rest cannot change it
+            if len(cleaned) >= max_len:
+                return cleaned[:max_len]
+            limit *= 2
+
+    return _clean_html(text).strip()[:max_len]
+
+
+# Location name aliases for common misspellings
+LOCATION_NAME_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "sankhuwasava": "sankhuwasabha",
+        "panchthar": "pachthar",
+        "madesh": "madhesh",
+        "sidhupalchowk": "sindhupalchok",
+        "kavrepalanchowk": "kavrepalanchok",
+        "makawanpur": "makwanpur",
+        "chitawan": "chitwan",
+        "parbat": "parwat",
+        "rukumkot": "eastern rukum",
+        "arghakhachi": "arghakhanchi",
+        "nawalparasi": "nawalpur",
+        "rukum": "western rukum",
+        "sudurpashchim": "sudur paschimanchal",
+        "achham": "acham",
+    }
+)
+
 
+# Administrative suffixes stripped by _normalize_location_name. Longer forms
+# come first so "sub metropolitan city" is not cut down to "sub".
+_LOCATION_SUFFIXES = (
+    "sub metropolitan city",
+    "sub-metropolitan city",
+    "metropolitan city",
+    "rural municipality",
+    "municipality",
+    "province",
+    "pradesh",
+    "district",
+    "उपमहानगरपालिका",
+    "महानगरपालिका",
+    "गाउँपालिका",
+    "नगरपालिका",
+    "प्रदेश",
+    "जिल्ला",
+)
+_LOCATION_SUFFIX_RE = re.compile(
+    r"\s*(?:" + "|".join(map(re.escape, _LOCATION_SUFFIXES)) + r")$"
+)
 
+
+@lru_cache(maxsize=8192)
+def _name_key(name: str) -> str:
+    """Exact-match cache key for a location or organization name.
+
+    casefold() rather than lower() so caseless matching also holds for
+    non-ASCII names (e.g. "STRASSE" and "Straße" share a key).
+    """
+    return name.strip().casefold()
+
+
+@lru_cache(maxsize=4096)
 def _normalize_location_name(name: str) -> str:
-    """Normalize location name for matching."""
+    """Normalize location name for matching, including misspelling aliases."""
     s = (name or "").strip().lower()
     if not s:
         return s
     s = s.replace(",", " ")
     s = " ".join(s.split())
-    suffixes = [
-        "province",
-        "pradesh",
-        "प्रदेश",
-        "district",
-        "जिल्ला",
-        "metropolitan city",
-        "महानगरपालिका",
-        "sub metropolitan city",
-        "sub-metropolitan city",
-        "उपमहानगरपालिका",
+    # The anchored regex is only run for names that end in a suffix
+    if s.endswith(_LOCATION_SUFFIXES):
+        s = _LOCATION_SUFFIX_RE.sub("", s).strip()
+    return LOCATION_NAME_ALIASES.get(s, s)
+
+
+# Minimum SequenceMatcher ratio for a fuzzy location name match, and the
+# lookup levels it applies to. Municipality names are left out: many real
+# ones differ by a letter or two and share "nagarpalika"/"gaunpalika".
+LOCATION_FUZZY_CUTOFF = 0.88
+LOCATION_FUZZY_LEVELS = frozenset({"district", "province"})
+
+
+def _words_similar(name: str, candidate: str, cutoff: float) -> bool:
+    """Whether two names have the same word count and pairwise similar words.
+
+    A misspelling changes letters within words; this rejects near-identical
+    names that differ by a whole word, such as "rukum west" / "rukum east".
+    """
+    words = name.split()
+    other_words = candidate.split()
+    return len(words) == len(other_words) and all(
+        a == b or SequenceMatcher(None, a, b).ratio() >= cutoff
+        for a, b in zip(words, other_words)
+    )
+
+
+def _closest_name(name: str, candidates: List[str], cutoff: float) -> Optional[str]:
+    """Return the candidate most similar to ``name`` scoring at least ``cutoff``.
+
+    Scores are difflib SequenceMatcher ratios and ties keep the earliest
+    candidate; candidates must also pass _words_similar. Each candidate is
+    first checked against a cheap upper bound (rapidfuzz's Indel ratio when
+    installed, otherwise difflib's quick ratios), so results do not depend
+    on rapidfuzz being installed.
+    """
+    best_match = None
+    # Until a match is found, a score equal to the cutoff qualifies
+    floor = cutoff - 1e-9
+    seq = SequenceMatcher(None, name)
+    for candidate in candidates:
+        if _indel_ratio is not None:
+            # Small slack keeps float rounding from pruning a qualifying match
+            if _indel_ratio(name, candidate) / 100.0 + 1e-9 <= floor:
+                continue
+            seq.set_seq2(candidate)
+        else:
+            seq.set_seq2(candidate)
+            if seq.real_quick_ratio() <= floor or seq.quick_ratio() <= floor:
+                continue
+        score = seq.ratio()
+        if score > floor and _words_similar(name, candidate, cutoff):
+            best_match = candidate
+            floor = score
+    return best_match
+
+
+# model_dump() shapes captured once, so organization and project payloads
+# can be built as plain dicts instead of validating and dumping a pydantic
+# model per record
+_PRIMARY_NAME_DUMP = Name(kind=NameKind.PRIMARY, en=NameParts(full="-")).model_dump()
+_NAME_PARTS_DUMP = _PRIMARY_NAME_DUMP["en"]
+_EN_LANG_TEXT_DUMP = LangText(en=LangTextValue(value="-")).model_dump()
+
+
+def _name_parts_dump(full: str) -> Dict[str, Any]:
+    """Return NameParts(full=full).model_dump()."""
+    return {**_NAME_PARTS_DUMP, "full": full}
+
+
+def _primary_name_dump(full: str) -> Dict[str, Any]:
+    """Return Name(kind=PRIMARY, en=NameParts(full=full)).model_dump()."""
+    return {**_PRIMARY_NAME_DUMP, "en": _name_parts_dump(full)}
+
+
+def _en_lang_text_dump(value: str, provenance: ProvenanceMethod) -> Dict[str, Any]:
+    """Return LangText(en=LangTextValue(value, provenance)).model_dump()."""
+    return {
+        **_EN_LANG_TEXT_DUMP,
+        "en": {**_EN_LANG_TEXT_DUMP["en"], "value": value, "provenance": provenance},
+    }
+
+
+# Location sub-types indexed in the municipality lookup
+MUNICIPALITY_SUBTYPES = frozenset(
+    {
+        "metropolitan_city",
+        "sub_metropolitan_city",
         "municipality",
-        "नगरपालिका",
+        "rural_municipality",
+    }
+)
+
+
+def _iter_full_names(names: List[Any]) -> Iterator[str]:
+    """Yield every non-empty English and Nepali full name of an entity."""
+    for nm in names:
+        if nm.en and nm.en.full:
+            yield nm.en.full
+        if nm.ne and nm.ne.full:
+            yield nm.ne.full
+
+
+# Maximum create_entity calls in flight in _create_organizations
+ORG_CREATE_CONCURRENCY = 20
+
+# Maximum create_relationship calls in flight for a project
+RELATIONSHIP_CONCURRENCY = 16
+
+# Maximum projects migrated concurrently by _migrate_projects
+PROJECT_CONCURRENCY = 32
+
+# Maximum created entities/relationships deleted concurrently on rollback
+ROLLBACK_CONCURRENCY = 256
+
+# Maximum length of an imported project description, in characters
+DESCRIPTION_MAX_LENGTH = 5000
+
+# Pre-transformed project fields copied into the entity payload as-is
+PROJECT_PASSTHROUGH_FIELDS = (
+    "implementing_agency",
+    "executing_agency",
+    "financing",
+    "total_commitment",
+    "total_disbursement",
+    "dates",
+    "sectors",
+    "tags",
+    "donor_extensions",
+)
+
+# Agency lists in _migration_metadata linked to each project, in order, with
+# the relationship type and the verb used in its change description
+ORG_RELATIONSHIP_FIELDS = (
+    ("development_agencies", "FUNDED_BY", "funded by"),
+    ("implementing_agencies", "IMPLEMENTED_BY", "implemented by"),
+    ("executing_agencies", "EXECUTED_BY", "executed by"),
+)
+
+# Agency lists in _migration_metadata and whether they hold donors
+AGENCY_FIELDS = (
+    ("development_agencies", True),
+    ("implementing_agencies", False),
+    ("executing_agencies", False),
+    ("government_agencies", False),
+)
+
+# Low-cardinality string fields interned by _intern_project, at the top
+# level, in each agency of _migration_metadata and in each location
+_INTERNED_PROJECT_FIELDS = ("type", "sub_type", "stage")
+_INTERNED_AGENCY_FIELDS = ("name", "architecture", "group")
+_INTERNED_LOCATION_FIELDS = ("location_type", "province", "district", "municipality")
+
+
+def _intern_fields(record: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    """Replace the given string values of ``record`` with interned copies."""
+    for field in fields:
+        value = record.get(field)
+        if type(value) is str:
+            record[field] = sys.intern(value)
+
+
+def _intern_project(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the repeated strings of a loaded project record in place.
+
+    Stages, agency names/classifications and location names recur across
+    thousands of records; interning keeps one copy of each and makes the
+    dict lookups keyed on them compare by identity.
+    """
+    _intern_fields(project, _INTERNED_PROJECT_FIELDS)
+    migration_meta = project.get("_migration_metadata")
+    if isinstance(migration_meta, dict):
+        for field, _ in AGENCY_FIELDS:
+            for agency in migration_meta.get(field) or ():
+                if isinstance(agency, dict):
+                    _intern_fields(agency, _INTERNED_AGENCY_FIELDS)
+        for loc in migration_meta.get("locations") or ():
+            if isinstance(loc, dict):
+                _intern_fields(loc, _INTERNED_LOCATION_FIELDS)
+    return project
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation so a name is scanned once."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Name keywords identifying Nepal government bodies
+_GOV_KEYWORD_RE = _keyword_pattern(
+    (
+        "ministry of",
+        "department of",
+        "office of",
+        "government of nepal",
+        "nepal government",
+        "commission",
+        "secretariat",
+        "authority",
+        "council",
+        "board",
+        "bureau",
+        # Nepali local government units
+        "gaunpalika",
+        "nagarpalika",
+        "mahanagarpalika",
         "rural municipality",
-        "गाउँपालिका",
-    ]
-    for suffix in suffixes:
-        if s.endswith(suffix):
-            s = s[: -len(suffix)].strip()
-            s = " ".join(s.split())
-    return s
+        "municipality",
+        "metropolitan",
+        "district",
+        "province",
+        "pradesh",
+    )
+)
 
+# Name keywords identifying international organizations / bilateral agencies
+_INTL_KEYWORD_RE = _keyword_pattern(
+    (
+        "international",
+        "world bank",
+        "asian development",
+        "united nations",
+        "usaid",
+        "jica",
+        "dfid",
+        "giz",
+        "european union",
+        "embassy",
+        "cooperation agency",
+        "development bank",
+        "monetary fund",
+    )
+)
 
-# Location name aliases for common misspellings
-LOCATION_NAME_ALIASES = {
-    "sankhuwasava": "sankhuwasabha",
-    "panchthar": "pachthar",
-    "madesh": "madhesh",
-    "sidhupalchowk": "sindhupalchok",
-    "kavrepalanchowk": "kavrepalanchok",
-    "makawanpur": "makwanpur",
-    "chitawan": "chitwan",
-    "parbat": "parwat",
-    "rukumkot": "eastern rukum",
-    "arghakhachi": "arghakhanchi",
-    "nawalparasi": "nawalpur",
-    "rukum": "western rukum",
-    "sudurpashchim": "sudur paschimanchal",
-    "achham": "acham",
+
+# Exact DFMIS architecture values and the subtype the rules below give them
+_ARCHITECTURE_SUBTYPES: Dict[str, EntitySubType] = {
+    "government of nepal": EntitySubType.GOVERNMENT_BODY,
+    "multilateral partners": EntitySubType.INTERNATIONAL_ORG,
+    "multilateral": EntitySubType.INTERNATIONAL_ORG,
+    "bilateral partners": EntitySubType.INTERNATIONAL_ORG,
 }
 
+# Exact DFMIS (architecture, group) pairs whose subtype depends on the group
+_ARCHITECTURE_GROUP_SUBTYPES: Dict[Tuple[str, str], EntitySubType] = {
+    ("non-government organisation", "ngo"): EntitySubType.NGO,
+    ("non-government organisation", "ingo"): EntitySubType.INTERNATIONAL_ORG,
+}
 
-def _map_organization_subtype(
-    architecture_name: str = "",
-    group_name: str = "",
-    org_name: str = "",
-    is_donor: bool = False,
-) -> EntitySubType:
-    """
-    Map DFMIS organization to appropriate entity subtypes.
 
-    Uses three sources of information:
-    1. architecture_name - from DFMIS raw_payload (most reliable for donors)
-    2. group_name - from DFMIS raw_payload
-    3. org_name - organization name (used for implementing/executing agencies)
-    4. is_donor - whether this is a funding organization (affects default)
+@lru_cache(maxsize=1024)
+def _classification_subtype(
+    architecture_name: Optional[str], group_name: Optional[str]
+) -> Optional[EntitySubType]:
+    """Subtype implied by a DFMIS architecture/group pair, if any.
 
-    Default behavior:
-    - Donors without clear classification → INTERNATIONAL_ORG (foreign aid context)
-    - Implementing/executing agencies without clear classification → NGO (local implementers)
+    Only a few dozen distinct pairs occur, so results are memoized.
     """
     arch_lower = (architecture_name or "").strip().lower()
     group_lower = (group_name or "").strip().lower()
-    name_lower = (org_name or "").strip().lower()
+
+    # 0. Fast path for the DFMIS architecture/group values seen in practice
+    subtype = _ARCHITECTURE_SUBTYPES.get(arch_lower)
+    if subtype is None:
+        subtype = _ARCHITECTURE_GROUP_SUBTYPES.get((arch_lower, group_lower))
+    if subtype is not None:
+        return subtype
 
     # 1. Check architecture name first (most reliable for donors)
     if "government of nepal" in arch_lower:
@@ -194,55 +542,40 @@ def _map_organization_subtype(
     if "line ministries" in group_lower:
         return EntitySubType.GOVERNMENT_BODY
 
+    return None
+
+
+def _map_organization_subtype(
+    architecture_name: str = "",
+    group_name: str = "",
+    org_name: str = "",
+    is_donor: bool = False,
+) -> EntitySubType:
+    """
+    Map DFMIS organization to appropriate entity subtypes.
+
+    Uses three sources of information:
+    1. architecture_name - from DFMIS raw_payload (most reliable for donors)
+    2. group_name - from DFMIS raw_payload
+    3. org_name - organization name (used for implementing/executing agencies)
+    4. is_donor - whether this is a funding organization (affects default)
+
+    Default behavior:
+    - Donors without clear classification → INTERNATIONAL_ORG (foreign aid context)
+    - Implementing/executing agencies without clear classification → NGO (local implementers)
+    """
+    # 1-2. Architecture and group classification (see _classification_subtype)
+    subtype = _classification_subtype(architecture_name, group_name)
+    if subtype is not None:
+        return subtype
+
     # 3. Name-based detection for implementing/executing agencies
+    name_lower = (org_name or "").strip().lower()
     if name_lower:
-        # Nepal government bodies
-        gov_keywords = [
-            "ministry of",
-            "department of",
-            "office of",
-            "government of nepal",
-            "nepal government",
-            "commission",
-            "secretariat",
-            "authority",
-            "council",
-            "board",
-            "bureau",
-            # Nepali local government units
-            "gaunpalika",
-            "nagarpalika",
-            "mahanagarpalika",
-            "rural municipality",
-            "municipality",
-            "metropolitan",
-            "district",
-            "province",
-            "pradesh",
-        ]
-        for kw in gov_keywords:
-            if kw in name_lower:
-                return EntitySubType.GOVERNMENT_BODY
-
-        # International organizations / bilateral agencies
-        intl_keywords = [
-            "international",
-            "world bank",
-            "asian development",
-            "united nations",
-            "usaid",
-            "jica",
-            "dfid",
-            "giz",
-            "european union",
-            "embassy",
-            "cooperation agency",
-            "development bank",
-            "monetary fund",
-        ]
-        for kw in intl_keywords:
-            if kw in name_lower:
-                return EntitySubType.INTERNATIONAL_ORG
+        if _GOV_KEYWORD_RE.search(name_lower):
+            return EntitySubType.GOVERNMENT_BODY
+        if _INTL_KEYWORD_RE.search(name_lower):
+            return EntitySubType.INTERNATIONAL_ORG
 
     # 4. Default based on role
     # Donors are typically international orgs (foreign aid)
@@ -253,6 +586,115 @@ def _map_organization_subtype(
         return EntitySubType.NGO
 
 
+@lru_cache(maxsize=None)
+def _organization_attribution_dump(architecture_label: str) -> Dict[str, Any]:
+    """Return the shared (read-only) attribution of an architecture's organizations."""
+    return {
+        "title": _en_lang_text_dump("MoF DFMIS Organization", ProvenanceMethod.HUMAN),
+        "details": _en_lang_text_dump(
+            f"Organization from MoF DFMIS - {architecture_label}",
+            ProvenanceMethod.HUMAN,
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def _source_attribution_dump(source_label: str) -> Dict[str, Any]:
+    """Return the attribution dict shared by every project of a source.
+
+    The same dict is handed to each create_entity call and must not be
+    mutated; the publication service validates it into a new model.
+    """
+    return {
+        "title": _en_lang_text_dump(source_label, ProvenanceMethod.HUMAN),
+        "details": _en_lang_text_dump(
+            f"Imported from {source_label} on {DATE}", ProvenanceMethod.HUMAN
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def _source_identifier_name_dump(source_label: str) -> Dict[str, Any]:
+    """Return the shared (read-only) name of a source's project identifier."""
+    return _en_lang_text_dump(f"{source_label} Project ID", ProvenanceMethod.HUMAN)
+
+
+def _build_project_entity_data(
+    project_data: Dict[str, Any], slug: str, source_label: str
+) -> Dict[str, Any]:
+    """Build the create_entity payload for a pre-transformed project record.
+
+    Pure function of its inputs (no I/O); ``project_data["names"]`` must be
+    non-empty.
+    """
+    # Build names
+    names = []
+    for name_entry in project_data["names"]:
+        en = name_entry.get("en")
+        ne = name_entry.get("ne")
+        names.append(
+            {
+                **_PRIMARY_NAME_DUMP,
+                "kind": NameKind(name_entry.get("kind", "PRIMARY")),
+                "en": _name_parts_dump(en.get("full")) if en else None,
+                "ne": _name_parts_dump(ne.get("full")) if ne else None,
+            }
+        )
+
+    # Build description (LangText dict from DFMIS, plain string from WB,
+    # ADB and JICA)
+    description = None
+    desc_data = project_data.get("description")
+    if isinstance(desc_data, dict):
+        desc_data = (desc_data.get("en") or {}).get("value")
+    if desc_data and isinstance(desc_data, str):
+        clean_desc = _strip_html_tags(desc_data, DESCRIPTION_MAX_LENGTH)
+        if clean_desc:
+            description = _en_lang_text_dump(clean_desc, ProvenanceMethod.IMPORTED)
+
+    # Build attributions based on source
+    attributions = [_source_attribution_dump(source_label)]
+
+    # Build identifiers
+    identifiers = []
+    project_url = project_data.get("project_url")
+    if project_url:
+        # Extract project ID from slug
+        project_id = next(
+            (slug.removeprefix(p) for p in _SLUG_PREFIXES if slug.startswith(p)),
+            slug,
+        )
+        identifiers.append(
+            {
+                "scheme": IdentifierScheme.OTHER,
+                "name": _source_identifier_name_dump(source_label),
+                "value": project_id,
+                "url": str(project_url),
+            }
+        )
+
+    # Build entity data, inserting optional fields only when they are set
+    entity_data: Dict[str, Any] = {
+        "slug": slug,
+        "names": names,
+        "attributions": attributions,
+    }
+    if description is not None:
+        entity_data["description"] = description
+    if identifiers:
+        entity_data["identifiers"] = identifiers
+    stage = project_data.get("stage", "unknown")
+    if stage is not None:
+        entity_data["stage"] = stage
+    for field in PROJECT_PASSTHROUGH_FIELDS:
+        value = project_data.get(field)
+        if value is not None:
+            entity_data[field] = value
+    if project_url:
+        entity_data["project_url"] = str(project_url)
+    return entity_data
+
+
 class ProjectMigration:
     """Migration class for development projects from multiple sources."""
 
@@ -285,12 +727,22 @@ class ProjectMigration:
         self.created_entity_ids: List[str] = []
         self.created_relationship_ids: List[str] = []
         self.organization_cache: Dict[str, str] = {}  # org_name -> entity_id
-        self.location_lookup: Dict[str, Any] = {}
-        self.province_lookup: Dict[str, Any] = {}
-        self.district_lookup: Dict[str, Any] = {}
-        self.municipality_lookup: Dict[str, Any] = {}
-        # Track all migrated projects for deduplication (converted to matcher format)
-        self.migrated_projects: List[Dict[str, Any]] = []
+        self.existing_project_ids: Set[str] = set()
+        # project id -> its creation in this run, resolved to the entity (or
+        # None if creation failed and the ID was released)
+        self._project_creations: Dict[str, "asyncio.Future[Optional[Any]]"] = {}
+        # (level, lowercased or normalized name) -> location id, where level
+        # is "province", "district" or "municipality"
+        self.location_ids: Dict[Tuple[str, str], str] = {}
+        # level -> names indexed for that level, built for fuzzy matching
+        self._location_names_by_level: Dict[str, List[str]] = {}
+        # (level, raw name) -> resolved location id (None for misses)
+        self._resolved_location_ids: Dict[Tuple[str, str], Optional[str]] = {}
+        # Index of all migrated projects for deduplication, shared by the
+        # matchers of later sources and grown as each project is created
+        self.project_index = ProjectIndex()
+        # Bounds concurrent create_relationship calls across a project
+        self._relationship_semaphore = asyncio.Semaphore(RELATIONSHIP_CONCURRENCY)
 
     async def run(self) -> None:
         """Run the migration for all sources."""
@@ -300,8 +752,13 @@ class ProjectMigration:
 
         try:
             await self._setup_author()
-            await self._build_location_lookups()
-            await self._build_organization_cache()
+            # The three lookup tables are independent reads, so fetch them
+            # concurrently
+            await asyncio.gather(
+                self._build_location_lookups(),
+                self._build_organization_cache(),
+                self._build_existing_project_cache(),
+            )
 
             # Process each source in order
             total_created = 0
@@ -351,16 +808,28 @@ class ProjectMigration:
             await self._rollback()
             raise
 
-    def _load_projects_from_file(self, filename: str) -> List[Dict[str, Any]]:
-        """Load projects from a JSONL file in the source directory."""
-        projects = []
+    def _iter_projects_from_file(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Yield projects one at a time from a JSONL file in the source directory.
+
+        Raises FileNotFoundError on first iteration if the file is missing.
+        """
         source_file = self.context.migration_dir / "source" / filename
+        with open(source_file, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield _intern_project(_json_loads(line))
+
+    def _load_projects_from_file(self, filename: str) -> List[Dict[str, Any]]:
+        """Load projects from a JSONL file in the source directory.
+
+        The migration walks each source more than once (organization
+        extraction, deduplication, creation), so the projects are
+        materialized; single-pass callers should use
+        _iter_projects_from_file instead.
+        """
         try:
-            with open(source_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        projects.append(json.loads(line))
+            projects = list(self._iter_projects_from_file(filename))
             self.context.log(
                 f"  Loaded {len(projects)} projects from source/{filename}"
             )
@@ -386,12 +855,12 @@ class ProjectMigration:
         Returns:
             Tuple of (filtered_projects, skipped_count)
         """
-        if not self.migrated_projects:
+        if not self.project_index:
             self.context.log(f"  No existing projects to match against, importing all")
             return projects, 0
 
-        # Create matcher with existing projects
-        matcher = matcher_class(self.migrated_projects)
+        # Create matcher over the shared index of existing projects
+        matcher = matcher_class(self.project_index)
 
         filtered = []
         skipped = 0
@@ -443,7 +912,7 @@ class ProjectMigration:
 
     async def _setup_author(self) -> None:
         """Create the migration author."""
-        author = Author(slug=text_to_slug(AUTHOR), name=AUTHOR)
+        author = Author(slug=_slug(AUTHOR), name=AUTHOR)
         await self.context.db.put_author(author)
         self.author_id = author.id
         self.context.log(f"Created author: {author.name} ({self.author_id})")
@@ -454,68 +923,62 @@ class ProjectMigration:
             entity_type="location", limit=10_000
         )
 
+        # Lookup level each location sub-type is indexed under; other
+        # sub-types are never looked up by project metadata
+        levels = {"province": "province", "district": "district"}
+        levels.update(dict.fromkeys(MUNICIPALITY_SUBTYPES, "municipality"))
+
         for loc in locations:
             st = loc.sub_type.value if loc.sub_type else None
-            for nm in loc.names:
-                if nm.en and nm.en.full:
-                    key_full = nm.en.full.strip().lower()
-                    key_norm = _normalize_location_name(nm.en.full)
-                    self.location_lookup[key_full] = loc
-                    self.location_lookup[key_norm] = loc
-                    if st == "province":
-                        self.province_lookup[key_full] = loc
-                        self.province_lookup[key_norm] = loc
-                    elif st == "district":
-                        self.district_lookup[key_full] = loc
-                        self.district_lookup[key_norm] = loc
-                    elif st in [
-                        "metropolitan_city",
-                        "sub_metropolitan_city",
-                        "municipality",
-                        "rural_municipality",
-                    ]:
-                        self.municipality_lookup[key_full] = loc
-                        self.municipality_lookup[key_norm] = loc
-                if nm.ne and nm.ne.full:
-                    key_ne = nm.ne.full.strip().lower()
-                    key_ne_norm = _normalize_location_name(nm.ne.full)
-                    self.location_lookup[key_ne] = loc
-                    self.location_lookup[key_ne_norm] = loc
-                    if st == "province":
-                        self.province_lookup[key_ne] = loc
-                        self.province_lookup[key_ne_norm] = loc
-                    elif st == "district":
-                        self.district_lookup[key_ne] = loc
-                        self.district_lookup[key_ne_norm] = loc
-                    elif st in [
-                        "metropolitan_city",
-                        "sub_metropolitan_city",
-                        "municipality",
-                        "rural_municipality",
-                    ]:
-                        self.municipality_lookup[key_ne] = loc
-                        self.municipality_lookup[key_ne_norm] = loc
-
-        self.context.log(f"Built location lookups: {len(self.location_lookup)} entries")
+            level = levels.get(st)
+            if level is None:
+                continue
+            # Names repeated across a location's name entries index identically
+            for full_name in dict.fromkeys(_iter_full_names(loc.names)):
+                self._register_location_name(loc, full_name, level)
+
+        self.context.log(f"Built location lookups: {len(self.location_ids)} entries")
+
+    def _register_location_name(self, loc: Any, name: str, level: str) -> None:
+        """Index a location under its lowercased and normalized name."""
+        # Normalizing the lowercased key lets spelling variants that differ
+        # only in case or padding share one normalization cache entry
+        key_full = _name_key(name)
+        key_norm = _normalize_location_name(key_full)
+        self.location_ids[(level, key_full)] = loc.id
+        if key_norm != key_full:
+            self.location_ids[(level, key_norm)] = loc.id
 
     async def _build_organization_cache(self) -> None:
         """Build cache of existing organizations."""
         orgs = await self.context.db.list_entities(
             entity_type="organization", limit=10_000
         )
+        # The first organization listed under a name keeps it, so a name
+        # shared by two organizations resolves deterministically
+        setdefault = self.organization_cache.setdefault
         for org in orgs:
-            for name in org.names:
-                if name.en and name.en.full:
-                    key = name.en.full.strip().lower()
-                    self.organization_cache[key] = org.id
-                if name.ne and name.ne.full:
-                    key = name.ne.full.strip().lower()
-                    self.organization_cache[key] = org.id
+            for full_name in _iter_full_names(org.names):
+                setdefault(_name_key(full_name), org.id)
 
         self.context.log(
             f"Built organization cache: {len(self.organization_cache)} entries"
         )
 
+    async def _build_existing_project_cache(self) -> None:
+        """Build the set of project IDs already in the database (e.g. partial runs).
+
+        Only IDs are kept; the few matching entities are fetched on demand.
+        """
+        projects = await self.context.db.list_entities(
+            limit=15_000, entity_type="project", sub_type="development_project"
+        )
+        self.existing_project_ids = {project.id for project in projects}
+
+        self.context.log(
+            f"Built existing project cache: {len(self.existing_project_ids)} entries"
+        )
+
     def _load_projects(self) -> List[Dict[str, Any]]:
         """Load projects from the pre-transformed JSONL file (backward compatibility)."""
         return self._load_projects_from_file("dfmis_projects.jsonl")
@@ -528,61 +991,24 @@ class ProjectMigration:
         Returns a dict mapping org_name (lowercase) to org metadata.
         """
         orgs: Dict[str, Dict[str, Any]] = {}
+        cache = self.organization_cache
 
         for project_data in projects:
             migration_meta = project_data.get("_migration_metadata", {})
 
-            # Extract from development_agencies (donors)
-            for agency in migration_meta.get("development_agencies", []):
-                if isinstance(agency, dict) and agency.get("name"):
-                    name = agency["name"]
-                    key = name.strip().lower()
-                    if key not in orgs and key not in self.organization_cache:
-                        orgs[key] = {
-                            "name": name,
-                            "architecture": agency.get("architecture", ""),
-                            "group": agency.get("group", ""),
-                            "is_donor": True,
-                        }
-
-            # Extract from implementing_agencies
-            for agency in migration_meta.get("implementing_agencies", []):
-                if isinstance(agency, dict) and agency.get("name"):
-                    name = agency["name"]
-                    key = name.strip().lower()
-                    if key not in orgs and key not in self.organization_cache:
-                        orgs[key] = {
-                            "name": name,
-                            "architecture": agency.get("architecture", ""),
-                            "group": agency.get("group", ""),
-                            "is_donor": False,
-                        }
-
-            # Extract from executing_agencies
-            for agency in migration_meta.get("executing_agencies", []):
-                if isinstance(agency, dict) and agency.get("name"):
-                    name = agency["name"]
-                    key = name.strip().lower()
-                    if key not in orgs and key not in self.organization_cache:
-                        orgs[key] = {
-                            "name": name,
-                            "architecture": agency.get("architecture", ""),
-                            "group": agency.get("group", ""),
-                            "is_donor": False,
-                        }
-
-            # Extract from government_agencies
-            for agency in migration_meta.get("government_agencies", []):
-                if isinstance(agency, dict) and agency.get("name"):
-                    name = agency["name"]
-                    key = name.strip().lower()
-                    if key not in orgs and key not in self.organization_cache:
-                        orgs[key] = {
-                            "name": name,
-                            "architecture": agency.get("architecture", ""),
-                            "group": agency.get("group", ""),
-                            "is_donor": False,
-                        }
+            for field, is_donor in AGENCY_FIELDS:
+                for agency in migration_meta.get(field, ()):
+                    if not isinstance(agency, dict) or not (name := agency.get("name")):
+                        continue
+                    key = _name_key(name)
+                    if key in orgs or key in cache:
+                        continue
+                    orgs[key] = {
+                        "name": name,
+                        "architecture": agency.get("architecture", ""),
+                        "group": agency.get("group", ""),
+                        "is_donor": is_donor,
+                    }
 
         self.context.log(f"Extracted {len(orgs)} unique organizations from projects")
         return orgs
@@ -592,9 +1018,13 @@ class ProjectMigration:
         slug_to_orgs: Dict[str, List[str]] = {}
 
         for key, data in org_data.items():
-            slug = text_to_slug(data["name"])
+            slug = _slug(data["name"])
             if not slug or len(slug) < 3:
-                slug = f"org-{hash(data['name']) % 100000}"
+                # Stable across runs, unlike hash() under PYTHONHASHSEED
+                digest = hashlib.blake2b(
+                    data["name"].encode("utf-8"), digest_size=4
+                ).hexdigest()
+                slug = f"org-{digest}"
             if len(slug) > 100:
                 slug = slug[:100]
 
@@ -611,61 +1041,61 @@ class ProjectMigration:
         }
         if collisions:
             self.context.log(f"WARNING: Found {len(collisions)} slug collisions:")
+            name_to_entry = {data["name"]: data for data in org_data.values()}
+            # Suffixed slugs must not land on another organization's slug
+            used_slugs = set(slug_to_orgs)
             for slug, names in collisions.items():
                 self.context.log(f"  {slug}: {names}")
-                # Resolve by appending hash suffix
-                for i, name in enumerate(names[1:], start=2):
-                    for key, data in org_data.items():
-                        if data["name"] == name:
-                            data["slug"] = f"{slug}-{i}"
-                            self.context.log(f"    Resolved: {name} -> {data['slug']}")
+                # Resolve by appending the lowest free numeric suffix
+                suffix = 2
+                for name in names[1:]:
+                    while f"{slug}-{suffix}" in used_slugs:
+                        suffix += 1
+                    data = name_to_entry[name]
+                    data["slug"] = f"{slug}-{suffix}"
+                    used_slugs.add(data["slug"])
+                    suffix += 1
+                    self.context.log(f"    Resolved: {name} -> {data['slug']}")
 
     async def _create_organizations(self, org_data: Dict[str, Dict[str, Any]]) -> None:
         """Create all organizations in batch."""
         created_count = 0
         skipped_count = 0
 
+        # Determine subtypes and expected IDs up front
+        planned = []
         for key, data in org_data.items():
-            # Determine subtype
             subtype = _map_organization_subtype(
                 data.get("architecture", ""),
                 data.get("group", ""),
                 data["name"],
                 data.get("is_donor", False),
             )
+            expected_id = f"entity:organization/{subtype.value}/{data['slug']}"
+            planned.append((key, data, subtype, expected_id))
+
+        # Check which organizations already exist in a single batch lookup
+        existing_ids: Set[str] = set()
+        if planned:
+            result = await self.context.search.get_entities_batch(
+                [expected_id for _, _, _, expected_id in planned]
+            )
+            existing_ids = {entity.id for entity in result.entities}
 
+        pending = []
+        for key, data, subtype, expected_id in planned:
             slug = data["slug"]
-            expected_id = f"entity:organization/{subtype.value}/{slug}"
 
-            # Check if already exists
-            existing = await self.context.db.get_entity(expected_id)
-            if existing:
+            if expected_id in existing_ids:
                 self.organization_cache[key] = expected_id
                 skipped_count += 1
                 continue
 
+            architecture_label = data.get("architecture") or "Development Partner"
             entity_data = {
                 "slug": slug,
-                "names": [
-                    Name(
-                        kind=NameKind.PRIMARY, en=NameParts(full=data["name"])
-                    ).model_dump()
-                ],
-                "attributions": [
-                    Attribution(
-                        title=LangText(
-                            en=LangTextValue(
-                                value="MoF DFMIS Organization", provenance="human"
-                            )
-                        ),
-                        details=LangText(
-                            en=LangTextValue(
-                                value=f"Organization from MoF DFMIS - {data.get('architecture') or 'Development Partner'}",
-                                provenance="human",
-                            )
-                        ),
-                    ).model_dump()
-                ],
+                "names": [_primary_name_dump(data["name"])],
+                "attributions": [_organization_attribution_dump(architecture_label)],
             }
 
             # Add attributes if available
@@ -676,25 +1106,58 @@ class ProjectMigration:
                 if data.get("group"):
                     entity_data["attributes"]["group"] = data["group"]
 
-            try:
-                org_entity = await self.context.publication.create_entity(
-                    entity_type=EntityType.ORGANIZATION,
-                    entity_subtype=subtype,
-                    entity_data=entity_data,
-                    author_id=self.author_id,
-                    change_description=f"Import organization from MoF DFMIS: {data['name']}",
-                )
-                self.organization_cache[key] = org_entity.id
-                self.created_entity_ids.append(org_entity.id)
-                created_count += 1
-            except ValueError as e:
-                self.context.log(f"  Error creating organization {data['name']}: {e}")
-                raise
+            pending.append((key, data, subtype, entity_data))
+
+        # Create every new organization in one gather; the semaphore bounds
+        # how many creates are in flight without a slow create stalling the
+        # rest of a fixed-size batch
+        semaphore = asyncio.Semaphore(ORG_CREATE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                self._create_organization_bounded(semaphore, data, subtype, entity_data)
+                for _, data, subtype, entity_data in pending
+            ),
+            return_exceptions=True,
+        )
+
+        # Record every success before raising so rollback can see it
+        first_error: Optional[BaseException] = None
+        for (key, data, _, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, ValueError):
+                    self.context.log(
+                        f"  Error creating organization {data['name']}: {result}"
+                    )
+                if first_error is None:
+                    first_error = result
+                continue
+            self.organization_cache[key] = result.id
+            self.created_entity_ids.append(result.id)
+            created_count += 1
+        if first_error is not None:
+            raise first_error
 
         self.context.log(
             f"Organizations: created {created_count}, skipped {skipped_count} existing"
         )
 
+    async def _create_organization_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        data: Dict[str, Any],
+        subtype: EntitySubType,
+        entity_data: Dict[str, Any],
+    ) -> Any:
+        """Create one organization, limited by the given semaphore."""
+        async with semaphore:
+            return await self.context.publication.create_entity(
+                entity_type=EntityType.ORGANIZATION,
+                entity_subtype=subtype,
+                entity_data=entity_data,
+                author_id=self.author_id,
+                change_description=f"Import organization from MoF DFMIS: {data['name']}",
+            )
+
     async def _migrate_projects(
         self,
         projects: List[Dict[str, Any]],
@@ -713,8 +1176,10 @@ class ProjectMigration:
         """
         count = 0
         relationship_count = 0
+        failed = asyncio.Event()
 
-        for project_data in projects:
+        async def process(project_data: Dict[str, Any]) -> Optional[Any]:
+            nonlocal count, relationship_count
             try:
                 # Create project entity
                 project_entity = await self._create_project_entity(
@@ -724,14 +1189,11 @@ class ProjectMigration:
                     self.context.log(
                         f"  Warning: Failed to create project - missing slug or names: {project_data.get('slug', 'unknown')}"
                     )
-                    continue
+                    return None
 
                 self.created_entity_ids.append(project_entity.id)
                 count += 1
 
-                # Track for deduplication against future sources
-                self.migrated_projects.append(project_data)
-
                 # Create relationships
                 rel_count = await self._create_project_relationships(
                     project_entity.id, project_data
@@ -740,13 +1202,42 @@ class ProjectMigration:
 
                 if count % 100 == 0:
                     self.context.log(f"  Processed {count} {source_label} projects...")
+                return project_entity
 
             except Exception as e:
+                failed.set()
                 self.context.log(
                     f"  Error processing project {project_data.get('slug', 'unknown')}: {e}"
                 )
                 raise
 
+        results: List[Optional[Any]] = [None] * len(projects)
+        queue = iter(enumerate(projects))
+
+        async def worker() -> None:
+            # Workers share one iterator, so each project is taken exactly once
+            for index, project_data in queue:
+                # Stop starting new projects once one has failed
+                if failed.is_set():
+                    return
+                results[index] = await process(project_data)
+
+        # PROJECT_CONCURRENCY workers run projects concurrently (rather than
+        # one task per project); in-flight projects finish before the first
+        # error is re-raised so rollback sees every entity that was created
+        outcomes = await asyncio.gather(
+            *(worker() for _ in range(min(PROJECT_CONCURRENCY, len(projects)))),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        # Track for deduplication against future sources, in source order
+        for project_data, project_entity in zip(projects, results):
+            if project_entity is not None:
+                self.project_index.add(project_data)
+
         self.context.log(f"  Created {count} {source_label} project entities")
         self.context.log(f"  Created {relationship_count} relationships")
         return count, relationship_count
@@ -771,270 +1262,171 @@ class ProjectMigration:
         if not slug:
             return None
 
+        # Projects without names cannot be created
+        if not project_data.get("names"):
+            return None
+
         # Ensure slug is valid (lowercase, alphanumeric with hyphens only)
         slug = slug.lower()
         if len(slug) > 100:
             slug = slug[:100]
         if len(slug) < 3:
-            slug = f"project-{int(datetime.now().timestamp())}"
+            # Derived from the record, unlike a timestamp, so concurrent
+            # projects get distinct slugs and reruns reproduce them
+            digest = hashlib.blake2b(
+                f"{slug}|{project_data['names'][0]}".encode("utf-8"), digest_size=4
+            ).hexdigest()
+            slug = f"project-{digest}"
 
-        # Build names
-        names_data = project_data.get("names", [])
-        if not names_data:
-            return None
+        expected_id = f"entity:project/development_project/{slug}"
 
-        names = []
-        for name_entry in names_data:
-            name_obj = Name(
-                kind=NameKind(name_entry.get("kind", "PRIMARY")),
-                en=(
-                    NameParts(full=name_entry.get("en", {}).get("full"))
-                    if name_entry.get("en")
-                    else None
-                ),
-                ne=(
-                    NameParts(full=name_entry.get("ne", {}).get("full"))
-                    if name_entry.get("ne")
-                    else None
-                ),
-            )
-            names.append(name_obj.model_dump())
-
-        # Build description
-        description = None
-        desc_data = project_data.get("description")
-        if desc_data:
-            if isinstance(desc_data, dict):
-                en_desc = desc_data.get("en", {})
-                if en_desc and en_desc.get("value"):
-                    clean_desc = _strip_html_tags(en_desc.get("value", ""))
-                    if clean_desc:
-                        description = LangText(
-                            en=LangTextValue(
-                                value=clean_desc[:5000], provenance="imported"
-                            )
-                        ).model_dump()
-            elif isinstance(desc_data, str):
-                # Handle string descriptions (from WB, ADB, JICA)
-                clean_desc = _strip_html_tags(desc_data)
-                if clean_desc:
-                    description = LangText(
-                        en=LangTextValue(value=clean_desc[:5000], provenance="imported")
-                    ).model_dump()
-
-        # Build attributions based on source
-        attribution_title = source_label
-        attribution_details = f"Imported from {source_label} on {DATE}"
-        attributions = [
-            Attribution(
-                title=LangText(
-                    en=LangTextValue(value=attribution_title, provenance="human")
-                ),
-                details=LangText(
-                    en=LangTextValue(value=attribution_details, provenance="human")
-                ),
-            ).model_dump()
-        ]
-
-        # Build identifiers
-        identifiers = []
-        project_url = project_data.get("project_url")
-        if project_url:
-            # Extract project ID from slug
-            project_id = slug
-            for prefix in ["dfmis-", "wb-", "adb-", "jica-"]:
-                if slug.startswith(prefix):
-                    project_id = slug[len(prefix) :]
-                    break
-            identifiers.append(
-                ExternalIdentifier(
-                    scheme="other",
-                    value=project_id,
-                    url=str(project_url),
-                    name=LangText(
-                        en=LangTextValue(
-                            value=f"{source_label} Project ID", provenance="human"
-                        )
-                    ),
-                ).model_dump()
+        # Slugs can collide (e.g. after truncation), so a project whose ID is
+        # already being created by another worker waits for that creation and
+        # shares its entity instead of racing it into "already exists"
+        while (creation := self._project_creations.get(expected_id)) is not None:
+            project = await creation
+            if project is not None:
+                self.context.log(f"  Skipping existing project {expected_id}")
+                return project
+
+        # Reserved before the first await below; removed again on failure so
+        # a waiting worker retries the creation itself
+        creation = asyncio.get_running_loop().create_future()
+        self._project_creations[expected_id] = creation
+        try:
+            project = await self._create_project_entity_unreserved(
+                project_data, slug, expected_id, source_label, change_description
             )
+        except BaseException:
+            del self._project_creations[expected_id]
+            creation.set_result(None)
+            raise
+        creation.set_result(project)
+        return project
 
-        # Build entity data
-        entity_data = {
-            "slug": slug,
-            "names": names,
-            "attributions": attributions,
-            "description": description,
-            "identifiers": identifiers if identifiers else None,
-            "stage": project_data.get("stage", "unknown"),
-            "implementing_agency": project_data.get("implementing_agency"),
-            "executing_agency": project_data.get("executing_agency"),
-            "financing": project_data.get("financing"),
-            "total_commitment": project_data.get("total_commitment"),
-            "total_disbursement": project_data.get("total_disbursement"),
-            "dates": project_data.get("dates"),
-            "sectors": project_data.get("sectors"),
-            "tags": project_data.get("tags"),
-            "donor_extensions": project_data.get("donor_extensions"),
-            "project_url": str(project_url) if project_url else None,
-        }
-
-        # Remove None values
-        entity_data = {k: v for k, v in entity_data.items() if v is not None}
-
+    async def _create_project_entity_unreserved(
+        self,
+        project_data: Dict[str, Any],
+        slug: str,
+        expected_id: str,
+        source_label: str,
+        change_description: str,
+    ) -> Any:
+        """Return the existing project for expected_id, or create it."""
         # Check if entity already exists (e.g., from a previous partial run)
-        expected_id = f"entity:project/development_project/{slug}"
-        existing = await self.context.db.get_entity(expected_id)
-        if existing:
-            self.context.log(f"  Skipping existing project {expected_id}")
-            return existing
+        if expected_id in self.existing_project_ids:
+            existing = await self.context.db.get_entity(expected_id)
+            if existing:
+                self.context.log(f"  Skipping existing project {expected_id}")
+                return existing
 
-        project = await self.context.publication.create_entity(
+        entity_data = _build_project_entity_data(project_data, slug, source_label)
+
+        return await self.context.publication.create_entity(
             entity_type=EntityType.PROJECT,
             entity_subtype=EntitySubType.DEVELOPMENT_PROJECT,
             entity_data=entity_data,
             author_id=self.author_id,
             change_description=change_description,
         )
-        return project
 
     async def _create_project_relationships(
         self, project_id: str, project_data: Dict[str, Any]
     ) -> int:
-        """Create relationships for a project entity using migration metadata."""
-        rel_count = 0
+        """Create relationships for a project entity using migration metadata.
+
+        Relationships are collected first and written with one batch call;
+        if the batch is rejected they are retried individually.
+        """
+        # (target_entity_id, relationship_type, change_description, log label)
+        pending: List[Tuple[str, str, str, str]] = []
+        # Bound once; these are called per agency/location in the loops below
+        queue = pending.append
+        get_org = self._get_organization_id
+        find_location = self._find_location_id
+
+        # (org_id, relationship_type) pairs already queued; agencies are often
+        # listed more than once per project
+        linked_orgs: Set[Tuple[str, str]] = set()
 
         # Get migration metadata from transformed data (includes agency/location details)
         migration_meta = project_data.get("_migration_metadata", {})
 
-        # Helper to create org relationship (orgs are pre-created in batch)
-        async def create_org_relationship(
-            agencies: List[Dict], rel_type: str, is_donor: bool
-        ) -> int:
-            count = 0
-            for agency in agencies:
-                if not isinstance(agency, dict):
-                    continue
-                org_name = agency.get("name", "")
-                if not org_name:
-                    continue
-                org_id = self._get_organization_id(org_name)
-                if org_id:
-                    try:
-                        rel = await self.context.publication.create_relationship(
-                            source_entity_id=project_id,
-                            target_entity_id=org_id,
-                            relationship_type=rel_type,
-                            author_id=self.author_id,
-                            change_description=f"Project {rel_type.lower().replace('_', ' ')} {org_name}",
-                        )
-                        self.created_relationship_ids.append(rel.id)
-                        count += 1
-                    except Exception as e:
-                        self.context.log(
-                            f"  Warning: Could not create {rel_type} relationship: {type(e).__name__}: {e}"
-                        )
-            return count
-
-        # Use migration metadata for relationships (has full org metadata)
+        # Use migration metadata for relationships (has full org metadata).
+        # Orgs are pre-created in batch, and all agency lists feed the same
+        # batch call, so their relationships are written together.
         if migration_meta:
-            # FUNDED_BY - from development_agencies (donors)
-            dev_agencies = migration_meta.get("development_agencies", [])
-            rel_count += await create_org_relationship(
-                dev_agencies, "FUNDED_BY", is_donor=True
-            )
-
-            # IMPLEMENTED_BY - from implementing_agencies
-            impl_agencies = migration_meta.get("implementing_agencies", [])
-            rel_count += await create_org_relationship(
-                impl_agencies, "IMPLEMENTED_BY", is_donor=False
-            )
-
-            # EXECUTED_BY - from executing_agencies
-            exec_agencies = migration_meta.get("executing_agencies", [])
-            rel_count += await create_org_relationship(
-                exec_agencies, "EXECUTED_BY", is_donor=False
-            )
+            for field, rel_type, verb in ORG_RELATIONSHIP_FIELDS:
+                for agency in migration_meta.get(field, ()):
+                    if not isinstance(agency, dict) or not (
+                        org_name := agency.get("name")
+                    ):
+                        continue
+                    org_id = get_org(org_name)
+                    if org_id and (org_id, rel_type) not in linked_orgs:
+                        linked_orgs.add((org_id, rel_type))
+                        queue((org_id, rel_type, f"Project {verb} {org_name}", ""))
         else:
             # Fallback to pre-transformed data (no org metadata, uses name heuristics)
             # FUNDED_BY from donor_extensions
             for donor_ext in project_data.get("donor_extensions", []):
-                if not isinstance(donor_ext, dict):
+                if not isinstance(donor_ext, dict) or not (
+                    donor_name := donor_ext.get("donor")
+                ):
                     continue
-                donor_name = donor_ext.get("donor", "")
-                if not donor_name:
-                    continue
-                org_id = self._get_organization_id(donor_name)
-                if org_id:
-                    try:
-                        rel = await self.context.publication.create_relationship(
-                            source_entity_id=project_id,
-                            target_entity_id=org_id,
-                            relationship_type="FUNDED_BY",
-                            author_id=self.author_id,
-                            change_description=f"Project funded by {donor_name}",
-                        )
-                        self.created_relationship_ids.append(rel.id)
-                        rel_count += 1
-                    except Exception as e:
-                        self.context.log(
-                            f"  Warning: Could not create FUNDED_BY relationship: {e}"
+                org_id = get_org(donor_name)
+                if org_id and (org_id, "FUNDED_BY") not in linked_orgs:
+                    linked_orgs.add((org_id, "FUNDED_BY"))
+                    queue(
+                        (
+                            org_id,
+                            "FUNDED_BY",
+                            f"Project funded by {donor_name}",
+                            "",
                         )
+                    )
 
             # IMPLEMENTED_BY from implementing_agency string
-            for agency_name in (
-                project_data.get("implementing_agency", "") or ""
-            ).split(","):
-                agency_name = agency_name.strip()
+            for agency_name in _split_names(project_data.get("implementing_agency")):
                 if not agency_name:
                     continue
-                org_id = self._get_organization_id(agency_name)
-                if org_id:
-                    try:
-                        rel = await self.context.publication.create_relationship(
-                            source_entity_id=project_id,
-                            target_entity_id=org_id,
-                            relationship_type="IMPLEMENTED_BY",
-                            author_id=self.author_id,
-                            change_description=f"Project implemented by {agency_name}",
-                        )
-                        self.created_relationship_ids.append(rel.id)
-                        rel_count += 1
-                    except Exception as e:
-                        self.context.log(
-                            f"  Warning: Could not create IMPLEMENTED_BY relationship: {e}"
+                org_id = get_org(agency_name)
+                if org_id and (org_id, "IMPLEMENTED_BY") not in linked_orgs:
+                    linked_orgs.add((org_id, "IMPLEMENTED_BY"))
+                    queue(
+                        (
+                            org_id,
+                            "IMPLEMENTED_BY",
+                            f"Project implemented by {agency_name}",
+                            "",
                         )
+                    )
 
             # EXECUTED_BY from executing_agency string
-            for agency_name in (project_data.get("executing_agency", "") or "").split(
-                ","
-            ):
-                agency_name = agency_name.strip()
+            for agency_name in _split_names(project_data.get("executing_agency")):
                 if not agency_name:
                     continue
-                org_id = self._get_organization_id(agency_name)
-                if org_id:
-                    try:
-                        rel = await self.context.publication.create_relationship(
-                            source_entity_id=project_id,
-                            target_entity_id=org_id,
-                            relationship_type="EXECUTED_BY",
-                            author_id=self.author_id,
-                            change_description=f"Project executed by {agency_name}",
-                        )
-                        self.created_relationship_ids.append(rel.id)
-                        rel_count += 1
-                    except Exception as e:
-                        self.context.log(
-                            f"  Warning: Could not create EXECUTED_BY relationship: {e}"
+                org_id = get_org(agency_name)
+                if org_id and (org_id, "EXECUTED_BY") not in linked_orgs:
+                    linked_orgs.add((org_id, "EXECUTED_BY"))
+                    queue(
+                        (
+                            org_id,
+                            "EXECUTED_BY",
+                            f"Project executed by {agency_name}",
+                            "",
                         )
+                    )
 
         # Create LOCATED_IN relationships from migration metadata
         if migration_meta:
             locations = migration_meta.get("locations", [])
 
-            # Track which locations we've already linked to avoid duplicates
+            # Track which locations we've already linked to avoid duplicates,
+            # and which name triples were already resolved (DFMIS lists the
+            # same municipality once per ward)
             linked_location_ids: Set[str] = set()
+            seen_location_names: Set[Tuple[Any, Any, Any]] = set()
 
             for loc in locations:
                 if not isinstance(loc, dict):
@@ -1045,139 +1437,234 @@ class ProjectMigration:
                 if location_type == "National Level":
                     continue
 
+                # The resolved location depends only on these three names
+                municipality_name = loc.get("municipality")
+                district_name = loc.get("district")
+                province_name = loc.get("province")
+                location_names = (municipality_name, district_name, province_name)
+                if location_names in seen_location_names:
+                    continue
+                seen_location_names.add(location_names)
+
                 # Try to link to municipality first, then district, then province
                 location_id = None
                 location_name = None
 
                 # Try municipality
-                municipality_name = loc.get("municipality")
                 if municipality_name:
-                    location_id = self._find_location_id(
-                        municipality_name, self.municipality_lookup
-                    )
+                    location_id = find_location(municipality_name, "municipality")
                     location_name = municipality_name
 
                 # Try district if no municipality match
-                if not location_id:
-                    district_name = loc.get("district")
-                    if district_name:
-                        location_id = self._find_location_id(
-                            district_name, self.district_lookup
-                        )
-                        location_name = district_name
+                if not location_id and district_name:
+                    location_id = find_location(district_name, "district")
+                    location_name = district_name
 
                 # Try province if no district match
-                if not location_id:
-                    province_name = loc.get("province")
-                    if province_name:
-                        location_id = self._find_location_id(
-                            province_name, self.province_lookup
-                        )
-                        location_name = province_name
+                if not location_id and province_name:
+                    location_id = find_location(province_name, "province")
+                    location_name = province_name
 
-                # Create relationship if we found a matching location
+                # Queue relationship if we found a matching location
                 if location_id and location_id not in linked_location_ids:
-                    try:
-                        rel = await self.context.publication.create_relationship(
-                            source_entity_id=project_id,
-                            target_entity_id=location_id,
-                            relationship_type="LOCATED_IN",
-                            author_id=self.author_id,
-                            change_description=f"Project located in {location_name}",
-                        )
-                        self.created_relationship_ids.append(rel.id)
-                        linked_location_ids.add(location_id)
-                        rel_count += 1
-                    except Exception as e:
-                        self.context.log(
-                            f"  Warning: Could not create LOCATED_IN relationship for {location_name}: {e}"
+                    linked_location_ids.add(location_id)
+                    queue(
+                        (
+                            location_id,
+                            "LOCATED_IN",
+                            f"Project located in {location_name}",
+                            f" for {location_name}",
                         )
+                    )
+
+        if not pending:
+            return 0
+
+        # One batch call per project; the publication service validates every
+        # relationship up front and shares entity/author lookups
+        try:
+            relationships = await self.context.publication.batch_create_relationships(
+                relationships_data=[
+                    {
+                        "source_entity_id": project_id,
+                        "target_entity_id": target_id,
+                        "relationship_type": rel_type,
+                        "change_description": change_description,
+                    }
+                    for target_id, rel_type, change_description, _ in pending
+                ],
+                author_id=self.author_id,
+                change_description=f"Relationships for {project_id}",
+            )
+        except RelationshipBatchValidationError:
+            # Nothing was stored; retry one by one so a single bad target
+            # only skips itself
+            return await self._create_relationships_individually(project_id, pending)
+        except RelationshipBatchStoreError as e:
+            # Record what was stored before the failure so rollback removes it
+            self.created_relationship_ids.extend(rel.id for rel in e.created)
+            raise
+
+        self.created_relationship_ids.extend(rel.id for rel in relationships)
+        return len(relationships)
+
+    async def _create_relationships_individually(
+        self, project_id: str, pending: List[Tuple[str, str, str, str]]
+    ) -> int:
+        """Create queued relationships concurrently, logging and skipping failures."""
+        results = await asyncio.gather(
+            *(
+                self._create_relationship_bounded(
+                    project_id, target_id, rel_type, change_description
+                )
+                for target_id, rel_type, change_description, _ in pending
+            ),
+            return_exceptions=True,
+        )
+
+        log = self.context.log
+        record = self.created_relationship_ids.append
+        rel_count = 0
+        for (_, rel_type, _, label), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                log(
+                    f"  Warning: Could not create {rel_type} relationship{label}: {type(result).__name__}: {result}"
+                )
+                continue
+            record(result.id)
+            rel_count += 1
 
         return rel_count
 
-    def _find_location_id(
-        self, location_name: str, lookup: Dict[str, Any]
-    ) -> Optional[str]:
-        """Find location ID from lookup dictionary."""
+    async def _create_relationship_bounded(
+        self,
+        project_id: str,
+        target_id: str,
+        rel_type: str,
+        change_description: str,
+    ) -> Any:
+        """Create one project relationship, limited by the relationship semaphore."""
+        async with self._relationship_semaphore:
+            return await self.context.publication.create_relationship(
+                source_entity_id=project_id,
+                target_entity_id=target_id,
+                relationship_type=rel_type,
+                author_id=self.author_id,
+                change_description=change_description,
+            )
+
+    def _find_location_id(self, location_name: str, level: str) -> Optional[str]:
+        """Find the ID of a province, district or municipality by name."""
         if not location_name:
             return None
 
-        # Try exact match first
-        key_lower = location_name.strip().lower()
-        if key_lower in lookup:
-            return lookup[key_lower].id
-
-        # Try normalized match
-        key_norm = _normalize_location_name(location_name)
-        if key_norm in lookup:
-            return lookup[key_norm].id
+        # Project metadata repeats the same few hundred names, so each
+        # (level, name) pair is resolved once and then served from one probe
+        resolved_key = (level, location_name)
+        try:
+            return self._resolved_location_ids[resolved_key]
+        except KeyError:
+            pass
 
-        # Try with alias
-        key_alias = LOCATION_NAME_ALIASES.get(key_norm, key_norm)
-        if key_alias in lookup:
-            return lookup[key_alias].id
+        # Try exact match first, then normalized match (aliases are applied
+        # during normalization)
+        key_full = _name_key(location_name)
+        location_id = self.location_ids.get((level, key_full))
+        if location_id is None:
+            key_norm = _normalize_location_name(key_full)
+            location_id = self.location_ids.get((level, key_norm))
+            # Fall back to the closest indexed name for unlisted misspellings
+            if location_id is None and key_norm and level in LOCATION_FUZZY_LEVELS:
+                match = _closest_name(
+                    key_norm,
+                    self._location_names_for_level(level),
+                    LOCATION_FUZZY_CUTOFF,
+                )
+                if match is not None:
+                    location_id = self.location_ids[(level, match)]
+                    self.context.log(
+                        f"  Fuzzy-matched {level} '{location_name}' to '{match}'"
+                    )
+        self._resolved_location_ids[resolved_key] = location_id
+        return location_id
 
-        return None
+    def _location_names_for_level(self, level: str) -> List[str]:
+        """Return the names indexed for a lookup level, in index order."""
+        names = self._location_names_by_level.get(level)
+        if names is None:
+            names = [key for lvl, key in self.location_ids if lvl == level]
+            self._location_names_by_level[level] = names
+        return names
 
     def _get_organization_id(self, org_name: str) -> Optional[str]:
         """Get organization ID from cache. Organizations are pre-created in batch."""
         if not org_name:
             return None
 
-        cache_key = org_name.strip().lower()
-        return self.organization_cache.get(cache_key)
+        return self.organization_cache.get(_name_key(org_name))
 
     async def _verify(self) -> None:
         """Verify the migration results."""
-        projects = await self.context.db.list_entities(
-            limit=15_000, entity_type="project", sub_type="development_project"
+        count = await self.context.db.count_entities(
+            entity_type="project", sub_type="development_project"
         )
-        self.context.log(f"Verified: {len(projects)} project entities in database")
+        self.context.log(f"Verified: {count} project entities in database")
 
     async def _rollback(self) -> None:
         """Rollback created entities and relationships on failure."""
         self.context.log("Rolling back migration...")
 
-        # Delete relationships first
-        for rel_id in reversed(self.created_relationship_ids):
-            try:
-                await self.context.publication.delete_relationship(
-                    relationship_id=rel_id,
-                    author_id=self.author_id,
-                    change_description="Rollback: migration failed",
+        # Delete relationships first, then entities, in reverse creation order
+        publication = self.context.publication
+        semaphore = asyncio.Semaphore(ROLLBACK_CONCURRENCY)
+        for delete, id_field, item_ids in (
+            (
+                publication.delete_relationship,
+                "relationship_id",
+                self.created_relationship_ids,
+            ),
+            (publication.delete_entity, "entity_id", self.created_entity_ids),
+        ):
+            # The semaphore is FIFO, so deletes still start in reverse order
+            await asyncio.gather(
+                *(
+                    self._rollback_item(semaphore, delete, id_field, item_id)
+                    for item_id in reversed(item_ids)
                 )
-                versions = await self.context.db.list_versions_by_entity(
-                    entity_or_relationship_id=rel_id, limit=1000
-                )
-                for v in versions:
-                    await self.context.db.delete_version(v.id)
-            except Exception:
-                pass
+            )
 
-        # Delete entities
-        for ent_id in reversed(self.created_entity_ids):
+        # Delete author
+        try:
+            await self.context.db.delete_author(self.author_id)
+        except Exception:
+            pass
+
+        self.context.log("Rollback completed")
+
+    async def _rollback_item(
+        self, semaphore: asyncio.Semaphore, delete: Any, id_field: str, item_id: str
+    ) -> None:
+        """Delete one created entity or relationship along with its versions.
+
+        The semaphore is held across the version deletes as well, so it bounds
+        every rollback call in flight, not only the top-level deletes.
+        """
+        async with semaphore:
             try:
-                await self.context.publication.delete_entity(
-                    entity_id=ent_id,
+                await delete(
+                    **{id_field: item_id},
                     author_id=self.author_id,
                     change_description="Rollback: migration failed",
                 )
                 versions = await self.context.db.list_versions_by_entity(
-                    entity_or_relationship_id=ent_id, limit=1000
+                    entity_or_relationship_id=item_id, limit=1000
                 )
-                for v in versions:
-                    await self.context.db.delete_version(v.id)
+                await self.context.db.delete_versions([v.id for v in versions])
             except Exception:
                 pass
 
-        # Delete author
-        try:
-            await self.context.db.delete_author(self.author_id)
-        except Exception:
-            pass
-
-        self.context.log("Rollback completed")
-
 
 async def migrate(context: MigrationContext) -> None:
     """
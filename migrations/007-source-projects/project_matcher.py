@@ -21,18 +21,29 @@ Usage:
     matcher = ProjectMatcher(existing_projects)
     result = matcher.find_match(new_project, source="WB")
 
+    # Or share one ProjectIndex across sources, growing it as projects import
+    index = ProjectIndex(existing_projects)
+    result = ADBMatcher(index).find_match(new_adb_project)
+    index.add(new_adb_project)
+
     if result.should_skip():
         # Skip - likely duplicate
     else:
         # Safe to import as new
 """
 
+import heapq
 import re
 from abc import ABC
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from enum import IntEnum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+except ImportError:  # Optional speedup; fall back to difflib's quick ratios
+    _indel_ratio = None
 
 
 class MatchLevel(IntEnum):
@@ -69,6 +80,83 @@ class MatchResult:
         return self.level == MatchLevel.HIGH_ID
 
 
+def normalize_project_name(name: str) -> str:
+    """Normalize project name for comparison."""
+    if not name:
+        return ""
+    # Lowercase, remove extra whitespace
+    name = name.lower().strip()
+    name = re.sub(r"\s+", " ", name)
+    # Remove common prefixes
+    prefixes = [
+        "nepal:",
+        "nepal -",
+        "nepal-",
+        "np:",
+        "np -",
+        "np-",
+        "nepal ",
+    ]
+    for prefix in prefixes:
+        if name.startswith(prefix):
+            name = name[len(prefix) :].strip()
+    # Remove special characters for comparison
+    name = re.sub(r"[^\w\s]", "", name)
+    return name
+
+
+def get_project_name(project: Dict) -> str:
+    """Extract project name from project data."""
+    # Try names array first (Entity format)
+    names = project.get("names", [])
+    if names:
+        for name in names:
+            if name.get("en", {}).get("full"):
+                return name["en"]["full"]
+    # Fallback to name field
+    return project.get("name", "")
+
+
+class ProjectIndex:
+    """Source-independent name indexes over already-imported projects.
+
+    Built once and grown with ``add`` as each source is imported, so the
+    matchers for later sources share it instead of re-normalizing every
+    existing project name.
+    """
+
+    def __init__(self, projects: Iterable[Dict[str, Any]] = ()):
+        self.projects: List[Dict[str, Any]] = []
+        # Normalized name -> most recently added project with that name
+        self.name_index: Dict[str, Dict] = {}
+        # (normalized name, project) in first-seen order, and positions into
+        # it blocked by name length for fuzzy matching
+        self.name_entries: List[Tuple[str, Dict]] = []
+        self.length_blocks: Dict[int, List[int]] = {}
+        self._name_positions: Dict[str, int] = {}
+        for project in projects:
+            self.add(project)
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def add(self, project: Dict[str, Any]) -> None:
+        """Index a newly imported project."""
+        self.projects.append(project)
+        norm_name = normalize_project_name(get_project_name(project))
+        if not norm_name:
+            return
+        self.name_index[norm_name] = project
+        pos = self._name_positions.get(norm_name)
+        if pos is None:
+            pos = len(self.name_entries)
+            self._name_positions[norm_name] = pos
+            self.name_entries.append((norm_name, project))
+            self.length_blocks.setdefault(len(norm_name), []).append(pos)
+        else:
+            self.name_entries[pos] = (norm_name, project)
+
+
 class ProjectMatcher(ABC):
     """Base class for project matching across sources.
 
@@ -89,26 +177,29 @@ class ProjectMatcher(ABC):
     FUZZY_THRESHOLD_LOW = 0.80  # For Level 1 (name only)
     AMOUNT_TOLERANCE = 0.15  # 15% tolerance for amount comparison
 
-    def __init__(self, existing_projects: List[Dict[str, Any]]):
+    def __init__(self, existing_projects: Union[List[Dict[str, Any]], "ProjectIndex"]):
         """Initialize matcher with existing projects.
 
         Args:
-            existing_projects: List of project dicts from database
+            existing_projects: List of project dicts from database, or a
+                ProjectIndex shared across matchers so name indexes are not
+                rebuilt for every source
         """
-        self.existing_projects = existing_projects
-        self._name_index: Dict[str, Dict] = {}
+        if isinstance(existing_projects, ProjectIndex):
+            index = existing_projects
+        else:
+            index = ProjectIndex(existing_projects)
+        self.existing_projects = index.projects
+        # Name indexes are shared with (and kept current by) the ProjectIndex
+        self._name_index = index.name_index
+        self._name_entries = index.name_entries
+        self._length_blocks = index.length_blocks
         self._donor_id_index: Dict[str, Dict] = {}
         self._build_indexes()
 
     def _build_indexes(self) -> None:
-        """Build lookup indexes for efficient matching."""
+        """Build source-specific lookup indexes for efficient matching."""
         for project in self.existing_projects:
-            # Index by normalized name
-            name = self._get_project_name(project)
-            norm_name = self._normalize_name(name)
-            if norm_name:
-                self._name_index[norm_name] = project
-
             # Index by donor project IDs (source-specific)
             for donor_id in self._extract_existing_donor_ids(project):
                 self._donor_id_index[donor_id.upper()] = project
@@ -208,14 +299,7 @@ class ProjectMatcher(ABC):
             )
 
         # Level 2 & 1: Fuzzy name matching
-        best_match = None
-        best_score = 0.0
-
-        for existing_name, existing_project in self._name_index.items():
-            score = self._similarity_score(project_name_norm, existing_name)
-            if score > best_score:
-                best_score = score
-                best_match = existing_project
+        best_match, best_score = self._best_fuzzy_match(project_name_norm)
 
         if best_match and best_score >= self.FUZZY_THRESHOLD_HIGH:
             existing_amount = self._get_total_amount(best_match)
@@ -250,38 +334,11 @@ class ProjectMatcher(ABC):
 
     def _normalize_name(self, name: str) -> str:
         """Normalize project name for comparison."""
-        if not name:
-            return ""
-        # Lowercase, remove extra whitespace
-        name = name.lower().strip()
-        name = re.sub(r"\s+", " ", name)
-        # Remove common prefixes
-        prefixes = [
-            "nepal:",
-            "nepal -",
-            "nepal-",
-            "np:",
-            "np -",
-            "np-",
-            "nepal ",
-        ]
-        for prefix in prefixes:
-            if name.startswith(prefix):
-                name = name[len(prefix) :].strip()
-        # Remove special characters for comparison
-        name = re.sub(r"[^\w\s]", "", name)
-        return name
+        return normalize_project_name(name)
 
     def _get_project_name(self, project: Dict) -> str:
         """Extract project name from project data."""
-        # Try names array first (Entity format)
-        names = project.get("names", [])
-        if names:
-            for name in names:
-                if name.get("en", {}).get("full"):
-                    return name["en"]["full"]
-        # Fallback to name field
-        return project.get("name", "")
+        return get_project_name(project)
 
     def _get_total_amount(self, project: Dict) -> float:
         """Extract total commitment amount from project."""
@@ -302,6 +359,62 @@ class ProjectMatcher(ABC):
                     pass
         return total
 
+    def _fuzzy_candidates(self, name: str) -> Iterator[Tuple[str, Dict]]:
+        """Yield indexed (name, project) pairs close enough in length to match.
+
+        A SequenceMatcher ratio is at most 2 * min(len) / (len_a + len_b), so
+        names whose length differs too much from ``name`` can never score
+        above the lowest fuzzy threshold and are skipped by length block.
+        """
+        threshold = min(self.FUZZY_THRESHOLD_LOW, self.FUZZY_THRESHOLD_HIGH)
+        length = len(name)
+        # Rounded outwards so the window is never narrower than the bound
+        shortest = int(threshold * length / (2 - threshold))
+        longest = int(length * (2 - threshold) / threshold) + 1
+        blocks = [
+            self._length_blocks[n]
+            for n in range(shortest, longest + 1)
+            if n in self._length_blocks
+        ]
+        for pos in heapq.merge(*blocks):
+            yield self._name_entries[pos]
+
+    def _best_fuzzy_match(self, name: str) -> Tuple[Optional[Dict], float]:
+        """Find the indexed project whose name is most similar to ``name``.
+
+        Only names from ``_fuzzy_candidates`` are considered, so for a
+        non-match the returned score is the best within that length window.
+        Scores are the same SequenceMatcher ratios as ``_similarity_score``,
+        but each candidate is first checked against a cheap upper bound so
+        the full ratio is only computed for names that could beat the
+        current best. The bound is rapidfuzz's Indel ratio (an exact LCS
+        ratio) when installed, otherwise difflib's quick ratios.
+        """
+        best_match = None
+        best_score = 0.0
+        if not name:
+            return best_match, best_score
+
+        seq = SequenceMatcher(None, name)
+        for existing_name, existing_project in self._fuzzy_candidates(name):
+            if _indel_ratio is not None:
+                # Small slack keeps float rounding from pruning a tie-breaker
+                if _indel_ratio(name, existing_name) / 100.0 + 1e-9 <= best_score:
+                    continue
+                seq.set_seq2(existing_name)
+            else:
+                seq.set_seq2(existing_name)
+                if seq.real_quick_ratio() <= best_score:
+                    continue
+                if seq.quick_ratio() <= best_score:
+                    continue
+            score = seq.ratio()
+            if score > best_score:
+                best_score = score
+                best_match = existing_project
+
+        return best_match, best_score
+
     def _similarity_score(self, s1: str, s2: str) -> float:
         """Calculate similarity between two strings."""
         if not s1 or not s2:
@@ -114,6 +114,30 @@ class EntityDatabase(ABC):
         """
         pass
 
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+    ) -> int:
+        """Count loadable entities, optionally filtered by type and subtype.
+
+        The count is the number of entities list_entities would return with
+        no limit: stored records that cannot be loaded (e.g. corrupt or
+        invalid files) are not counted. Overrides must keep this contract.
+
+        Args:
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+
+        Returns:
+            Number of entities matching the criteria
+        """
+        return len(
+            await self.list_entities(
+                limit=999999, entity_type=entity_type, sub_type=sub_type
+            )
+        )
+
     async def get_all_tags(self) -> List[str]:
         """Return all unique tag values across all entities, sorted."""
         entities = await self.list_entities(limit=999999)
@@ -214,6 +238,23 @@ class EntityDatabase(ABC):
         """
         pass
 
+    async def delete_versions(self, version_ids: List[str]) -> int:
+        """Delete several versions from the database.
+
+        Backends that can delete in bulk should override this.
+
+        Args:
+            version_ids: The unique identifiers of the versions to delete
+
+        Returns:
+            The number of versions that existed and were deleted
+        """
+        deleted = 0
+        for version_id in version_ids:
+            if await self.delete_version(version_id):
+                deleted += 1
+        return deleted
+
     @abstractmethod
     async def list_versions(
         self,
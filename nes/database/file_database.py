@@ -375,6 +375,29 @@ class FileDatabase(EntityDatabase):
         # Apply pagination
         return entities[offset : offset + limit]
 
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+    ) -> int:
+        """Count loadable entities, optionally filtered by type and subtype.
+
+        Files are loaded and skipped exactly as in list_entities, but nothing
+        is kept, so memory stays constant and there is no limit to exceed.
+        """
+        search_path = self._build_entity_search_path(entity_type, sub_type)
+        if not search_path.exists():
+            return 0
+
+        count = 0
+        for file_path in search_path.rglob("*.json"):
+            try:
+                if self._load_and_filter_entity(file_path) is not None:
+                    count += 1
+            except (json.JSONDecodeError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping invalid entity file {file_path}: {e}")
+        return count
+
     def _build_entity_search_path(
         self, entity_type: Optional[str] = None, sub_type: Optional[str] = None
     ) -> Path:
@@ -1102,6 +1125,17 @@ class FileDatabase(EntityDatabase):
 
         return False
 
+    async def delete_versions(self, version_ids: List[str]) -> int:
+        """Delete several versions in one call, returning how many existed."""
+        deleted = 0
+        for version_id in version_ids:
+            try:
+                self._id_to_path(version_id).unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+
     async def list_versions(
         self,
         limit: int = 100,
@@ -414,10 +414,7 @@ class MigrationRunner:
             Total entity count
         """
         try:
-            # Use database's list method with a high limit to get count
-            # This is a simple implementation - could be optimized with a dedicated count method
-            entities = await self.db.list_entities(limit=1000000)
-            return len(entities)
+            return await self.db.count_entities()
         except Exception as e:
             logger.warning(f"Failed to count entities: {e}")
             return 0
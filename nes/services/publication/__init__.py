@@ -1,5 +1,13 @@
 """Publication Service for managing entities and relationships with versioning."""
 
-from .service import PublicationService
+from .service import (
+    PublicationService,
+    RelationshipBatchStoreError,
+    RelationshipBatchValidationError,
+)
 
-__all__ = ["PublicationService"]
+__all__ = [
+    "PublicationService",
+    "RelationshipBatchStoreError",
+    "RelationshipBatchValidationError",
+]
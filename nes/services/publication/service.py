@@ -23,6 +23,24 @@ from nes.database.entity_database import EntityDatabase
 logger = logging.getLogger(__name__)
 
 
+class RelationshipBatchValidationError(ValueError):
+    """A relationship batch failed validation; nothing was stored."""
+
+
+class RelationshipBatchStoreError(Exception):
+    """Storing a validated relationship batch failed partway through.
+
+    Attributes:
+        created: Relationships stored before the failure, in input order
+    """
+
+    def __init__(self, created: List[Relationship], error: Exception):
+        super().__init__(
+            f"Stored {len(created)} relationship(s) before failing: {error}"
+        )
+        self.created = created
+
+
 class PublicationService:
     """Service for publishing and managing entities and relationships.
 
@@ -265,82 +283,22 @@ class PublicationService:
         if not target_entity:
             raise ValueError(f"Target entity {target_entity_id} does not exist")
 
-        # Validate temporal consistency
-        if start_date and end_date and end_date < start_date:
-            raise ValueError("Relationship end_date cannot be before start_date")
-
-        # Validate relationship type
-        valid_types = [
-            "AFFILIATED_WITH",
-            "EMPLOYED_BY",
-            "MEMBER_OF",
-            "PARENT_OF",
-            "CHILD_OF",
-            "SUPERVISES",
-            "LOCATED_IN",
-            "FUNDED_BY",
-            "IMPLEMENTED_BY",
-            "EXECUTED_BY",
-            "OVERSEEN_BY",
-        ]
-        if relationship_type not in valid_types:
-            raise ValueError(
-                f"Invalid relationship type: {relationship_type}. Must be one of {valid_types}"
-            )
+        self._validate_new_relationship(relationship_type, start_date, end_date)
 
         # Get or create author
         author = await self._get_or_create_author(author_id)
 
-        # Create version summary
-        # Note: We need to create the relationship first to get its ID
-        relationship_data = {
-            "source_entity_id": source_entity_id,
-            "target_entity_id": target_entity_id,
-            "type": relationship_type,
-            "start_date": start_date,
-            "end_date": end_date,
-            "attributes": attributes,
-            "created_at": datetime.now(UTC),
-        }
-
-        # Create temporary relationship to get ID
-        temp_relationship = Relationship.model_validate(relationship_data)
-        relationship_id = temp_relationship.id
-
-        # Create version summary
-        version_summary = VersionSummary(
-            entity_or_relationship_id=relationship_id,
-            type=VersionType.RELATIONSHIP,
-            version_number=1,
+        return await self._store_new_relationship(
+            source_entity_id=source_entity_id,
+            target_entity_id=target_entity_id,
+            relationship_type=relationship_type,
             author=author,
             change_description=change_description,
-            created_at=datetime.now(UTC),
+            start_date=start_date,
+            end_date=end_date,
+            attributes=attributes,
         )
 
-        # Add version summary to relationship data
-        relationship_data["version_summary"] = version_summary
-
-        # Create final relationship
-        relationship = Relationship.model_validate(relationship_data)
-
-        # Store relationship in database
-        await self.database.put_relationship(relationship)
-
-        # Create and store version with snapshot
-        version = Version(
-            entity_or_relationship_id=relationship_id,
-            type=VersionType.RELATIONSHIP,
-            version_number=1,
-            author=author,
-            change_description=change_description,
-            created_at=version_summary.created_at,
-            snapshot=relationship.model_dump(mode="json"),
-        )
-        await self.database.put_version(version)
-
-        logger.info(f"Created relationship {relationship_id} version 1")
-        return relationship
-
     async def update_relationship(
         self, relationship: Relationship, author_id: str, change_description: str
     ) -> Relationship:
@@ -582,8 +540,210 @@ class PublicationService:
 
         return entities
 
+    async def batch_create_relationships(
+        self,
+        relationships_data: List[Dict[str, Any]],
+        author_id: str,
+        change_description: str,
+    ) -> List[Relationship]:
+        """Create multiple relationships in batch.
+
+        Every relationship is validated before any is stored. Entity
+        existence checks and the author lookup are shared across the batch
+        rather than repeated for each relationship.
+
+        Args:
+            relationships_data: List of relationship data dictionaries with
+                source_entity_id, target_entity_id, relationship_type and
+                optionally start_date, end_date, attributes and a per-item
+                change_description
+            author_id: ID of the author creating the relationships
+            change_description: Description used for items without their own
+
+        Returns:
+            List of created relationships, in input order
+
+        Raises:
+            RelationshipBatchValidationError: If any relationship is invalid
+                (nothing is stored)
+            RelationshipBatchStoreError: If storing fails after validation;
+                carries the relationships already stored
+        """
+        entity_exists: Dict[str, bool] = {}
+
+        async def exists(entity_id: str) -> bool:
+            if entity_id not in entity_exists:
+                entity = await self.database.get_entity(entity_id)
+                entity_exists[entity_id] = entity is not None
+            return entity_exists[entity_id]
+
+        for rel_data in relationships_data:
+            if "source_entity_id" not in rel_data or "target_entity_id" not in rel_data:
+                raise RelationshipBatchValidationError(
+                    "Relationship must have source_entity_id and target_entity_id"
+                )
+            if "relationship_type" not in rel_data:
+                raise RelationshipBatchValidationError(
+                    "Relationship must have relationship_type"
+                )
+
+            source_entity_id = rel_data["source_entity_id"]
+            if not await exists(source_entity_id):
+                raise RelationshipBatchValidationError(
+                    f"Source entity {source_entity_id} does not exist"
+                )
+            target_entity_id = rel_data["target_entity_id"]
+            if not await exists(target_entity_id):
+                raise RelationshipBatchValidationError(
+                    f"Target entity {target_entity_id} does not exist"
+                )
+
+            try:
+                self._validate_new_relationship(
+                    rel_data["relationship_type"],
+                    rel_data.get("start_date"),
+                    rel_data.get("end_date"),
+                )
+                # Model validation is what _store_new_relationship would hit
+                # first, so run it before anything is written
+                Relationship.model_validate(
+                    {
+                        "source_entity_id": source_entity_id,
+                        "target_entity_id": target_entity_id,
+                        "type": rel_data["relationship_type"],
+                        "start_date": rel_data.get("start_date"),
+                        "end_date": rel_data.get("end_date"),
+                        "attributes": rel_data.get("attributes"),
+                        "created_at": datetime.now(UTC),
+                    }
+                )
+            except ValueError as e:
+                raise RelationshipBatchValidationError(str(e)) from e
+
+        if not relationships_data:
+            return []
+
+        author = await self._get_or_create_author(author_id)
+
+        relationships = []
+        try:
+            for rel_data in relationships_data:
+                relationship = await self._store_new_relationship(
+                    source_entity_id=rel_data["source_entity_id"],
+                    target_entity_id=rel_data["target_entity_id"],
+                    relationship_type=rel_data["relationship_type"],
+                    author=author,
+                    change_description=rel_data.get(
+                        "change_description", change_description
+                    ),
+                    start_date=rel_data.get("start_date"),
+                    end_date=rel_data.get("end_date"),
+                    attributes=rel_data.get("attributes"),
+                )
+                relationships.append(relationship)
+        except Exception as e:
+            raise RelationshipBatchStoreError(relationships, e) from e
+
+        return relationships
+
     # Helper methods
 
+    def _validate_new_relationship(
+        self,
+        relationship_type: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> None:
+        """Validate the type and dates of a relationship about to be created.
+
+        Raises:
+            ValueError: If the dates are inconsistent or the type is unknown
+        """
+        # Validate temporal consistency
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("Relationship end_date cannot be before start_date")
+
+        # Validate relationship type
+        valid_types = [
+            "AFFILIATED_WITH",
+            "EMPLOYED_BY",
+            "MEMBER_OF",
+            "PARENT_OF",
+            "CHILD_OF",
+            "SUPERVISES",
+            "LOCATED_IN",
+            "FUNDED_BY",
+            "IMPLEMENTED_BY",
+            "EXECUTED_BY",
+            "OVERSEEN_BY",
+        ]
+        if relationship_type not in valid_types:
+            raise ValueError(
+                f"Invalid relationship type: {relationship_type}. Must be one of {valid_types}"
+            )
+
+    async def _store_new_relationship(
+        self,
+        source_entity_id: str,
+        target_entity_id: str,
+        relationship_type: str,
+        author: Author,
+        change_description: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Relationship:
+        """Store a validated relationship as version 1 along with its version record."""
+        # Create version summary
+        # Note: We need to create the relationship first to get its ID
+        relationship_data = {
+            "source_entity_id": source_entity_id,
+            "target_entity_id": target_entity_id,
+            "type": relationship_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "attributes": attributes,
+            "created_at": datetime.now(UTC),
+        }
+
+        # Create temporary relationship to get ID
+        temp_relationship = Relationship.model_validate(relationship_data)
+        relationship_id = temp_relationship.id
+
+        # Create version summary
+        version_summary = VersionSummary(
+            entity_or_relationship_id=relationship_id,
+            type=VersionType.RELATIONSHIP,
+            version_number=1,
+            author=author,
+            change_description=change_description,
+            created_at=datetime.now(UTC),
+        )
+
+        # Add version summary to relationship data
+        relationship_data["version_summary"] = version_summary
+
+        # Create final relationship
+        relationship = Relationship.model_validate(relationship_data)
+
+        # Store relationship in database
+        await self.database.put_relationship(relationship)
+
+        # Create and store version with snapshot
+        version = Version(
+            entity_or_relationship_id=relationship_id,
+            type=VersionType.RELATIONSHIP,
+            version_number=1,
+            author=author,
+            change_description=change_description,
+            created_at=version_summary.created_at,
+            snapshot=relationship.model_dump(mode="json"),
+        )
+        await self.database.put_version(version)
+
+        logger.info(f"Created relationship {relationship_id} version 1")
+        return relationship
+
     async def _get_or_create_author(self, author_id: str) -> Author:
         """Get an existing author or create a new one.
 
@@ -433,3 +433,27 @@ class TestDirectoryTraversalOptimization:
         # Verify no overlap
         all_ids = [e.id for e in page1] + [e.id for e in page2] + [e.id for e in page3]
         assert len(all_ids) == len(set(all_ids))  # All unique
+
+    @pytest.mark.asyncio
+    async def test_count_entities_matches_list_entities(self, complex_db):
+        """Test that counting entity files agrees with listing entities."""
+        assert await complex_db.count_entities() == 20
+        assert await complex_db.count_entities(entity_type="person") == 10
+        assert (
+            await complex_db.count_entities(
+                entity_type="organization", sub_type="political_party"
+            )
+            == 5
+        )
+        assert await complex_db.count_entities(entity_type="project") == 0
+
+    @pytest.mark.asyncio
+    async def test_count_entities_skips_unloadable_files(self, complex_db):
+        """Test that a corrupt entity file is not counted, as in list_entities."""
+        corrupt = complex_db.base_path / "entity" / "person" / "corrupt.json"
+        corrupt.write_text("{not valid json", encoding="utf-8")
+
+        assert await complex_db.count_entities(entity_type="person") == 10
+        assert await complex_db.count_entities() == len(
+            await complex_db.list_entities(limit=100)
+        )
@@ -595,3 +595,23 @@ class TestEfficientVersionRetrieval:
         # All should be relationship versions
         assert len(results) == 3
         assert all(v.type == VersionType.RELATIONSHIP for v in results)
+
+    @pytest.mark.asyncio
+    async def test_delete_versions_in_bulk(self, populated_db):
+        """Test deleting an entity's versions with a single call."""
+        entity_id = "entity:person/ram-chandra-poudel"
+        versions = await populated_db.list_versions_by_entity(
+            entity_or_relationship_id=entity_id, limit=1000
+        )
+        version_ids = [v.id for v in versions]
+
+        assert await populated_db.delete_versions(version_ids) == 10
+        assert (
+            await populated_db.list_versions_by_entity(
+                entity_or_relationship_id=entity_id
+            )
+            == []
+        )
+
+        # Already-deleted versions are skipped rather than raising
+        assert await populated_db.delete_versions(version_ids) == 0
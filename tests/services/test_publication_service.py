@@ -651,6 +651,224 @@ class TestPublicationServiceCoordinatedOperations:
         assert len(results) == 3
         assert all(e.version_summary.version_number == 1 for e in results)
 
+    @pytest.mark.asyncio
+    async def test_batch_create_relationships(self, temp_db_path):
+        """Test batch creation of relationships from one source entity."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        person = await service.create_entity(
+            entity_prefix="person",
+            entity_data={
+                "slug": "batch-person",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Person"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+        orgs = [
+            await service.create_entity(
+                entity_prefix="organization/political_party",
+                entity_data={
+                    "slug": f"batch-party-{i}",
+                    "names": [{"kind": "PRIMARY", "en": {"full": f"Batch Party {i}"}}],
+                },
+                author_id="author:test",
+                change_description="Test",
+            )
+            for i in range(2)
+        ]
+
+        results = await service.batch_create_relationships(
+            relationships_data=[
+                {
+                    "source_entity_id": person.id,
+                    "target_entity_id": orgs[0].id,
+                    "relationship_type": "MEMBER_OF",
+                },
+                {
+                    "source_entity_id": person.id,
+                    "target_entity_id": orgs[1].id,
+                    "relationship_type": "AFFILIATED_WITH",
+                    "change_description": "Affiliation",
+                },
+            ],
+            author_id="author:test",
+            change_description="Batch import",
+        )
+
+        assert [r.target_entity_id for r in results] == [orgs[0].id, orgs[1].id]
+        assert all(r.version_summary.version_number == 1 for r in results)
+        assert results[0].version_summary.change_description == "Batch import"
+        assert results[1].version_summary.change_description == "Affiliation"
+        for relationship in results:
+            assert await db.get_relationship(relationship.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_batch_create_relationships_validates_before_storing(
+        self, temp_db_path
+    ):
+        """Test that an invalid relationship in a batch stores nothing."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        person = await service.create_entity(
+            entity_prefix="person",
+            entity_data={
+                "slug": "batch-person",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Person"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+        org = await service.create_entity(
+            entity_prefix="organization/political_party",
+            entity_data={
+                "slug": "batch-party",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Party"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await service.batch_create_relationships(
+                relationships_data=[
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": org.id,
+                        "relationship_type": "MEMBER_OF",
+                    },
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": "entity:organization/missing",
+                        "relationship_type": "MEMBER_OF",
+                    },
+                ],
+                author_id="author:test",
+                change_description="Batch import",
+            )
+
+        assert await service.get_relationships_by_entity(person.id) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_create_relationships_validates_models_before_storing(
+        self, temp_db_path
+    ):
+        """Test that a model validation error in a batch stores nothing."""
+        from nes.services.publication import (
+            PublicationService,
+            RelationshipBatchValidationError,
+        )
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        person = await service.create_entity(
+            entity_prefix="person",
+            entity_data={
+                "slug": "batch-person",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Person"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+        org = await service.create_entity(
+            entity_prefix="organization/political_party",
+            entity_data={
+                "slug": "batch-party",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Party"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+
+        with pytest.raises(RelationshipBatchValidationError):
+            await service.batch_create_relationships(
+                relationships_data=[
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": org.id,
+                        "relationship_type": "MEMBER_OF",
+                    },
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": org.id,
+                        "relationship_type": "AFFILIATED_WITH",
+                        "attributes": "not a mapping",
+                    },
+                ],
+                author_id="author:test",
+                change_description="Batch import",
+            )
+
+        assert await service.get_relationships_by_entity(person.id) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_create_relationships_reports_partial_store(self, temp_db_path):
+        """Test that a storage failure reports the relationships already stored."""
+        from nes.services.publication import (
+            PublicationService,
+            RelationshipBatchStoreError,
+        )
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        person = await service.create_entity(
+            entity_prefix="person",
+            entity_data={
+                "slug": "batch-person",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Person"}}],
+            },
+            author_id="author:test",
+            change_description="Test",
+        )
+        orgs = [
+            await service.create_entity(
+                entity_prefix="organization/political_party",
+                entity_data={
+                    "slug": f"batch-party-{i}",
+                    "names": [{"kind": "PRIMARY", "en": {"full": f"Batch Party {i}"}}],
+                },
+                author_id="author:test",
+                change_description="Test",
+            )
+            for i in range(2)
+        ]
+
+        put_relationship = db.put_relationship
+        stored = []
+
+        async def fail_second_put(relationship):
+            if stored:
+                raise OSError("disk full")
+            stored.append(relationship)
+            return await put_relationship(relationship)
+
+        db.put_relationship = fail_second_put
+
+        with pytest.raises(RelationshipBatchStoreError) as exc_info:
+            await service.batch_create_relationships(
+                relationships_data=[
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": org.id,
+                        "relationship_type": "MEMBER_OF",
+                    }
+                    for org in orgs
+                ],
+                author_id="author:test",
+                change_description="Batch import",
+            )
+
+        assert not isinstance(exc_info.value, ValueError)
+        assert [r.id for r in exc_info.value.created] == [stored[0].id]
+
 
 class TestPublicationServiceRollback:
     """Test rollback mechanisms for failed operations."""